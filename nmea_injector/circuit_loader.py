@@ -6,15 +6,78 @@ This module handles loading and parsing F1 circuit data from the circuits.geojso
 and provides utilities for working with circuit waypoints.
 """
 
+import functools
+import hashlib
+import importlib
 import json
+import math
 import os
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+import pickle
+import sys
+import threading
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Tuple, Optional
 
+import numpy as np
+from scipy.spatial import cKDTree
 
-@dataclass
-class CircuitInfo:
-    """Information about an F1 circuit."""
+# Files larger than this are streamed with ijson (when available) to cap peak memory
+STREAMING_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+# Bump whenever CircuitInfo changes so stale pickle caches are rebuilt
+CACHE_VERSION = 2
+
+
+def _user_cache_dir() -> str:
+    """Get the per-user cache directory for nmea_injector.
+    
+    Uses %LOCALAPPDATA% on Windows, ~/Library/Caches on macOS and
+    $XDG_CACHE_HOME (default ~/.cache) elsewhere.
+    """
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'nmea_injector')
+
+
+@functools.lru_cache(maxsize=None)
+def _optional_import(name: str):
+    """Import an optional parser backend on first use, or None if it is not installed.
+    
+    Backends (simdjson, orjson, ijson) are only needed when circuits are first
+    loaded, so they are not imported with the module.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _coordinate_array(raw_coordinates) -> np.ndarray:
+    """Convert parsed GeoJSON positions to a float64 (N, D) array."""
+    if hasattr(raw_coordinates, 'as_buffer') and len(raw_coordinates):
+        # simdjson array: copy the numbers straight into a flat C double buffer instead
+        # of creating a Python float per number. The buffer drops the position boundaries,
+        # so it is only used when every position has the same dimension; a matching total
+        # size alone could still come from mixed 2D and 3D positions.
+        width = len(raw_coordinates[0])
+        if width and all(len(coord) == width for coord in raw_coordinates):
+            flat = np.frombuffer(raw_coordinates.as_buffer(of_type='d'), dtype=np.float64)
+            return flat.reshape(-1, width)
+    try:
+        return np.asarray(raw_coordinates, dtype=np.float64)
+    except ValueError:
+        # Positions of mixed dimensions (valid GeoJSON) don't form a rectangular array;
+        # keep the longitude and latitude of every position that has both
+        positions = [(coord[0], coord[1]) for coord in raw_coordinates if len(coord) >= 2]
+        return np.array(positions, dtype=np.float64).reshape(-1, 2)
+
+
+class CircuitInfo(NamedTuple):
+    """Information about an F1 circuit (immutable, tuple-backed)."""
     id: str
     name: str
     location: str
@@ -22,65 +85,167 @@ class CircuitInfo:
     first_gp: int
     length: int  # meters
     altitude: int  # meters above sea level
-    coordinates: List[Tuple[float, float]]  # (longitude, latitude) pairs
+    coordinates: np.ndarray  # (N, 2) float64 array of (longitude, latitude) pairs
 
 
 class CircuitLoader:
     """Loads and manages F1 circuit data."""
     
-    def __init__(self, geojson_path: Optional[str] = None):
+    def __init__(self, geojson_path: Optional[str] = None, cache_dir: Optional[str] = None):
         """Initialize circuit loader.
         
         Args:
             geojson_path: Path to circuits.geojson file. If None, uses default path.
+            cache_dir: Directory for the parsed-circuit cache. If None, uses the
+                per-user cache directory.
         """
         if geojson_path is None:
             # Default to circuits.geojson in the same directory as this module
             geojson_path = os.path.join(os.path.dirname(__file__), 'circuits.geojson')
         
         self.geojson_path = geojson_path
+        # One cache file per source path, so different GeoJSON files never share a cache
+        source_key = hashlib.sha1(os.path.abspath(geojson_path).encode('utf-8')).hexdigest()[:16]
+        self.cache_path = os.path.join(
+            cache_dir if cache_dir is not None else _user_cache_dir(),
+            f"{os.path.basename(geojson_path)}.{source_key}.cache")
         self._circuits: Dict[str, CircuitInfo] = {}
+        self._circuits_view: Mapping[str, CircuitInfo] = MappingProxyType(self._circuits)
+        self._waypoint_cache: Dict[str, np.ndarray] = {}
+        self._waypoint_trees: Dict[str, Tuple[cKDTree, float]] = {}
+        self._load_lock = threading.Lock()
         self._loaded = False
     
+    def _source_stamp(self) -> Tuple[int, int, int]:
+        """Get the (cache version, mtime, size) stamp of the GeoJSON source file."""
+        stat = os.stat(self.geojson_path)
+        return CACHE_VERSION, stat.st_mtime_ns, stat.st_size
+    
+    def _load_cache(self) -> bool:
+        """Load circuits from the pickle cache if it matches the GeoJSON source.
+        
+        Returns:
+            True if the cache was valid and loaded, False otherwise.
+        """
+        try:
+            with open(self.cache_path, 'rb') as f:
+                stamp, circuits = pickle.load(f)
+            if stamp != self._source_stamp():
+                return False
+        except Exception:
+            # Missing, stale or unreadable cache - fall back to parsing the GeoJSON
+            return False
+        
+        self._circuits.clear()
+        self._circuits.update(circuits)
+        return True
+    
+    def _save_cache(self) -> None:
+        """Write parsed circuits to the pickle cache in the cache directory."""
+        temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                pickle.dump((self._source_stamp(), self._circuits), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            # Cache is an optimization only, e.g. the cache directory may be read-only
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    
+    def _iter_features(self):
+        """Yield the GeoJSON features from the source file.
+        
+        Large files are streamed one feature at a time with ijson; otherwise the
+        whole document is parsed with the fastest available parser.
+        """
+        ijson = _optional_import('ijson')
+        if ijson and os.path.getsize(self.geojson_path) > STREAMING_THRESHOLD_BYTES:
+            with open(self.geojson_path, 'rb') as f:
+                if next(ijson.items(f, 'type'), None) != 'FeatureCollection':
+                    raise ValueError("Invalid GeoJSON format: expected FeatureCollection")
+                f.seek(0)
+                yield from ijson.items(f, 'features.item', use_float=True)
+            return
+        
+        with open(self.geojson_path, 'rb') as f:
+            raw = f.read()
+        
+        simdjson = _optional_import('simdjson')
+        orjson = _optional_import('orjson')
+        if simdjson:
+            # On-demand document: values are only materialized when accessed,
+            # so unused properties and the bbox arrays are never converted
+            data = simdjson.Parser().parse(raw)
+        elif orjson:
+            data = orjson.loads(raw)
+        else:
+            data = json.loads(raw)
+        
+        if data.get('type') != 'FeatureCollection':
+            raise ValueError("Invalid GeoJSON format: expected FeatureCollection")
+        
+        yield from data.get('features', [])
+    
     def load_circuits(self) -> None:
-        """Load circuits from GeoJSON file."""
+        """Load circuits from the cache, or parse the GeoJSON file if the cache is stale."""
         if self._loaded:
             return
+        
+        with self._load_lock:
+            # Another thread may have finished loading while we waited for the lock
+            if not self._loaded:
+                self._load_circuits()
+    
+    def _load_circuits(self) -> None:
+        """Load circuits; must be called with _load_lock held."""
+        if self._load_cache():
+            self._mark_loaded()
+            print(f"Loaded {len(self._circuits)} F1 circuits from {self.cache_path}")
+            return
             
         try:
-            with open(self.geojson_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            if data.get('type') != 'FeatureCollection':
-                raise ValueError("Invalid GeoJSON format: expected FeatureCollection")
-            
-            for feature in data.get('features', []):
-                if feature.get('type') != 'Feature':
+            for feature in self._iter_features():
+                # Required fields are indexed directly; features missing any of
+                # them (or with null members) are skipped
+                try:
+                    if feature['type'] != 'Feature':
+                        continue
+                    
+                    properties = feature['properties']
+                    geometry = feature['geometry']
+                    
+                    if geometry['type'] != 'LineString':
+                        continue
+                    
+                    circuit_id = properties['id']
+                    name = properties['Name']
+                    
+                    # Extract coordinates into a contiguous (N, 2) array of [lon, lat] rows
+                    # (GeoJSON uses [longitude, latitude] order, extra dimensions are dropped)
+                    coordinates = _coordinate_array(geometry['coordinates'])
+                except (KeyError, TypeError, ValueError):
                     continue
                 
-                properties = feature.get('properties', {})
-                geometry = feature.get('geometry', {})
-                
-                if geometry.get('type') != 'LineString':
+                if coordinates.ndim != 2 or coordinates.shape[1] < 2:
                     continue
+                coordinates = np.ascontiguousarray(coordinates[:, :2])
                 
-                # Extract circuit information
-                circuit_id = properties.get('id', '')
-                name = properties.get('Name', '')
-                location = properties.get('Location', '')
-                opened = properties.get('opened', 0)
-                first_gp = properties.get('firstgp', 0)
-                length = properties.get('length', 0)
-                altitude = properties.get('altitude', 0)
-                
-                # Extract coordinates (convert from [lon, lat] to (lon, lat) tuples)
-                coordinates = []
-                for coord in geometry.get('coordinates', []):
-                    if len(coord) >= 2:
-                        # GeoJSON uses [longitude, latitude] order
-                        coordinates.append((coord[0], coord[1]))
+                # Extract optional circuit information
+                get_property = properties.get
+                location = get_property('Location', '')
+                if isinstance(location, str):
+                    # Circuits often share a location, so intern it to share one
+                    # string object and let sort-key comparisons hit the identity check
+                    location = sys.intern(location)
+                opened = get_property('opened', 0)
+                first_gp = get_property('firstgp', 0)
+                length = get_property('length', 0)
+                altitude = get_property('altitude', 0)
                 
-                if coordinates and circuit_id and name:
+                if len(coordinates) and circuit_id and name:
                     circuit = CircuitInfo(
                         id=circuit_id,
                         name=name,
@@ -93,22 +258,33 @@ class CircuitLoader:
                     )
                     self._circuits[circuit_id] = circuit
             
-            self._loaded = True
+            self._mark_loaded()
             print(f"Loaded {len(self._circuits)} F1 circuits from {self.geojson_path}")
+            self._save_cache()
             
         except Exception as e:
             print(f"Error loading circuits: {e}")
-            self._circuits = {}
+            self._circuits.clear()
+    
+    def _mark_loaded(self) -> None:
+        """Flag circuits as loaded and bind direct accessors.
+        
+        Circuits never change after loading, so the lookup accessors are shadowed
+        on the instance with bindings that skip the lazy-load check.
+        """
+        self.get_circuit = self._circuits.get
+        self.get_circuits = lambda: self._circuits_view
+        self._loaded = True
     
-    def get_circuits(self) -> Dict[str, CircuitInfo]:
+    def get_circuits(self) -> Mapping[str, CircuitInfo]:
         """Get all available circuits.
         
         Returns:
-            Dictionary mapping circuit IDs to CircuitInfo objects.
+            Read-only mapping of circuit IDs to CircuitInfo objects.
         """
         if not self._loaded:
             self.load_circuits()
-        return self._circuits.copy()
+        return self._circuits_view
     
     def get_circuit(self, circuit_id: str) -> Optional[CircuitInfo]:
         """Get a specific circuit by ID.
@@ -132,14 +308,14 @@ class CircuitLoader:
         if not self._loaded:
             self.load_circuits()
         
-        circuits = []
-        for circuit_id, circuit in self._circuits.items():
-            display_name = f"{circuit.name} ({circuit.location})"
-            circuits.append((circuit_id, display_name))
-        
-        # Sort by location, then by name
-        circuits.sort(key=lambda x: (self._circuits[x[0]].location, self._circuits[x[0]].name))
-        return circuits
+        # Build the sort key alongside each entry so sorting is a plain tuple
+        # comparison, sorted by location, then by name
+        keyed = [
+            (circuit.location, circuit.name, circuit_id, f"{circuit.name} ({circuit.location})")
+            for circuit_id, circuit in self._circuits.items()
+        ]
+        keyed.sort()
+        return [(circuit_id, display_name) for _, _, circuit_id, display_name in keyed]
     
     def convert_to_waypoints(self, circuit_id: str) -> List[Tuple[float, float]]:
         """Convert circuit coordinates to waypoint format.
@@ -151,43 +327,98 @@ class CircuitLoader:
             List of (latitude, longitude) tuples for waypoint targeting.
             Returns empty list if circuit not found.
         """
-        circuit = self.get_circuit(circuit_id)
-        if not circuit:
+        # A fresh list is returned as callers may edit their copy
+        waypoints = self.convert_to_waypoint_array(circuit_id)
+        if waypoints is None:
             return []
+        return list(map(tuple, waypoints.tolist()))
+    
+    def convert_to_waypoint_array(self, circuit_id: str) -> Optional[np.ndarray]:
+        """Get circuit waypoints as a read-only (n, 2) float64 array of (latitude, longitude) rows.
         
-        # Convert from (longitude, latitude) to (latitude, longitude) format
-        # and optionally downsample for reasonable waypoint count
-        waypoints = []
+        Args:
+            circuit_id: The circuit ID
+            
+        Returns:
+            The shared waypoint array, in the same order as convert_to_waypoints.
+            Returns None if circuit not found.
+        """
+        # Circuits are immutable once loaded, so conversions are computed once per circuit
+        waypoints = self._waypoint_cache.get(circuit_id)
+        if waypoints is None:
+            circuit = self.get_circuit(circuit_id)
+            if not circuit:
+                return None
+            waypoints = self._waypoint_cache[circuit_id] = self._downsample_waypoints(circuit)
+        return waypoints
+    
+    def _downsample_waypoints(self, circuit: CircuitInfo) -> np.ndarray:
+        """Downsample circuit coordinates to (latitude, longitude) waypoints."""
         coords = circuit.coordinates
         
         # For very detailed circuits, take every Nth point to avoid too many waypoints
         step = max(1, len(coords) // 50)  # Aim for ~50 waypoints maximum
         
-        for i in range(0, len(coords), step):
-            lon, lat = coords[i]
-            waypoints.append((lat, lon))
+        # Downsample and swap (longitude, latitude) columns to (latitude, longitude)
+        # in a single strided view
+        waypoints = coords[::step, ::-1]
         
         # Ensure we include the last point if it wasn't included by stepping
-        if len(coords) > 1 and len(waypoints) > 0:
-            last_coord = coords[-1]
-            last_waypoint = waypoints[-1]
-            # Check if the last coordinate is different from the last waypoint
-            if abs(last_coord[1] - last_waypoint[0]) > 1e-6 or abs(last_coord[0] - last_waypoint[1]) > 1e-6:
-                lon, lat = coords[-1]
-                waypoints.append((lat, lon))
+        # (without downsampling every point, including the last, is already kept)
+        if step > 1:
+            last_point = coords[-1:, ::-1]
+            if not np.allclose(waypoints[-1], last_point[0], rtol=0.0, atol=1e-6):
+                waypoints = np.vstack([waypoints, last_point])
         
+        # Contiguous so array consumers get it without a copy, read-only since it is shared
+        waypoints = np.ascontiguousarray(waypoints, dtype=np.float64)
+        waypoints.flags.writeable = False
         return waypoints
+    
+    def nearest_waypoint(self, circuit_id: str, lat: float,
+                         lon: float) -> Optional[Tuple[int, Tuple[float, float]]]:
+        """Find the circuit waypoint closest to a position.
+        
+        Args:
+            circuit_id: The circuit ID
+            lat: Latitude in decimal degrees
+            lon: Longitude in decimal degrees
+            
+        Returns:
+            (index, (latitude, longitude)) of the nearest waypoint, where index
+            refers to the list returned by convert_to_waypoints.
+            Returns None if circuit not found.
+        """
+        if circuit_id not in self._waypoint_trees:
+            waypoints = self.convert_to_waypoint_array(circuit_id)
+            if waypoints is None or not len(waypoints):
+                return None
+            
+            # Index an equirectangular projection around the circuit so that
+            # euclidean distance in the tree tracks ground distance
+            points = waypoints.copy()
+            lon_scale = math.cos(math.radians(points[:, 0].mean()))
+            points[:, 1] *= lon_scale
+            self._waypoint_trees[circuit_id] = (cKDTree(points), lon_scale)
+        
+        tree, lon_scale = self._waypoint_trees[circuit_id]
+        _, index = tree.query((lat, lon * lon_scale))
+        return int(index), tuple(self._waypoint_cache[circuit_id][index].tolist())
 
 
 # Global circuit loader instance
 _circuit_loader = None
+_circuit_loader_lock = threading.Lock()
 
 
 def get_circuit_loader() -> CircuitLoader:
     """Get the global circuit loader instance."""
     global _circuit_loader
     if _circuit_loader is None:
-        _circuit_loader = CircuitLoader()
+        with _circuit_loader_lock:
+            # Double-checked so concurrent first calls share a single instance
+            if _circuit_loader is None:
+                _circuit_loader = CircuitLoader()
     return _circuit_loader
 
 
@@ -212,7 +443,35 @@ def get_circuit_waypoints(circuit_id: str) -> List[Tuple[float, float]]:
     return get_circuit_loader().convert_to_waypoints(circuit_id)
 
 
-if __name__ == "__main__":
+def get_circuit_waypoint_array(circuit_id: str) -> Optional[np.ndarray]:
+    """Get waypoints for a specific F1 circuit as a read-only (n, 2) NumPy array.
+    
+    Args:
+        circuit_id: The circuit ID
+        
+    Returns:
+        Array of (latitude, longitude) rows, or None if circuit not found.
+    """
+    return get_circuit_loader().convert_to_waypoint_array(circuit_id)
+
+
+def get_nearest_circuit_waypoint(circuit_id: str, lat: float,
+                                 lon: float) -> Optional[Tuple[int, Tuple[float, float]]]:
+    """Get the waypoint of an F1 circuit closest to a position.
+    
+    Args:
+        circuit_id: The circuit ID
+        lat: Latitude in decimal degrees
+        lon: Longitude in decimal degrees
+        
+    Returns:
+        (index, (latitude, longitude)) of the nearest waypoint, or None.
+    """
+    return get_circuit_loader().nearest_waypoint(circuit_id, lat, lon)
+
+
+def main():
+    """Print a summary of the bundled circuits and the Silverstone waypoints."""
     # Test the circuit loader
     loader = CircuitLoader()
     circuits = loader.get_circuits()
@@ -226,4 +485,8 @@ if __name__ == "__main__":
     if silverstone_waypoints:
         print(f"\nSilverstone waypoints: {len(silverstone_waypoints)} points")
         print(f"First waypoint: {silverstone_waypoints[0]}")
-        print(f"Last waypoint: {silverstone_waypoints[-1]}")
\ No newline at end of file
+        print(f"Last waypoint: {silverstone_waypoints[-1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,16 +9,22 @@ import threading
 import time
 import math
 import csv
+import io
+import shutil
 import traceback
 import platform
 import subprocess
+import functools
+import queue
 from datetime import datetime
 from collections import deque
-from typing import Optional, Dict, Any
+from typing import Optional
 import json
 import os
 import sys
 
+import numpy as np
+
 # Try to import map component - fallback gracefully if not available
 try:
     import tkintermapview
@@ -42,6 +48,355 @@ from .circuit_loader import get_available_circuits, get_circuit_waypoints
 from .models import GpsReceiver
 from .constants import TargetingMode
 
+# Tile server URL for each entry in the map layer selector
+MAP_TILE_SERVERS = {
+    "OpenStreetMap": "https://a.tile.openstreetmap.org/{z}/{x}/{y}.png",
+    "Google normal": "https://mt1.google.com/vt/lyrs=m&x={x}&y={y}&z={z}",
+    "Google satellite": "https://mt1.google.com/vt/lyrs=s&x={x}&y={y}&z={z}",
+}
+
+# Bit assigned to each selectable NMEA sentence type in the output mask, in output order
+SENTENCE_BITS = {'GGA': 1, 'GLL': 2, 'GSA': 4, 'GSV': 8, 'RMC': 16, 'VTG': 32, 'ZDA': 64}
+
+# Most sentences moved from the ingest queue into the NMEA buffer per redraw
+MAX_NMEA_DRAIN = 256
+
+# Most sentences allowed to wait in the ingest queue; the oldest are dropped beyond this
+NMEA_INGEST_LIMIT = 1000
+
+# Above this many waypoints, JSON files are written compactly instead of indented
+COMPACT_JSON_WAYPOINTS = 256
+
+# 16x16 orange trail marker icon as base64 PNG: an orange (255, 140, 0) circle with a 2px
+# darker (200, 80, 0) outline and a translucent lighter (255, 200, 100, 180) center circle
+TRAIL_MARKER_ICON_PNG = (
+    "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAAbUlEQVR42mNgoBAw4pI4EcDwH13MYgOmekZiNOIziBGXZvOK"
+    "lK3oGk92zPFGN4SJWM3o4jD1TPgUETIE7gWYaYQ0Y/MOE6XROFwMgMUpcjwTE4AWGxgYmfAlFnyaMbyAnDxxGYItJVI3L5CT"
+    "GwEctjVyBwrtNwAAAABJRU5ErkJggg=="
+)
+
+# Fill and outline colors for the alternative trail marker icons
+ALTERNATIVE_ICON_COLORS = {
+    "orange": ((255, 140, 0, 255), (200, 80, 0, 255)),
+    "blue": ((0, 140, 255, 255), (0, 80, 200, 255)),
+    "green": ((140, 255, 0, 255), (80, 200, 0, 255)),
+    "red": ((255, 80, 80, 255), (200, 40, 40, 255))
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _sentences_for_mask(mask):
+    """Sentence types whose SENTENCE_BITS are set in `mask`, in output order."""
+    return tuple(name for name, bit in SENTENCE_BITS.items() if mask & bit)
+
+
+def _small_distance_m(lat1, lon1, lat2, lon2):
+    """Equirectangular distance in meters, accurate for points a few kilometers apart or less."""
+    deg = math.pi / 180
+    x = (lon2 - lon1) * math.cos((lat1 + lat2) * 0.5 * deg) * deg * 6371000
+    y = (lat2 - lat1) * deg * 6371000
+    return math.hypot(x, y)
+
+
+def epoch_millis(timestamp):
+    """Round an epoch timestamp in seconds to whole milliseconds.
+    
+    NmeaBuffer stores this value and format_nmea_timestamp displays it, so a time reads
+    the same whether it is shown straight away or read back from the buffer.
+    """
+    return round(timestamp * 1000)
+
+
+def format_nmea_timestamp(timestamp):
+    """Format an epoch timestamp as HH:MM:SS.mmm local time for display."""
+    seconds, millis = divmod(epoch_millis(timestamp), 1000)
+    tm = time.localtime(seconds)
+    return f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}.{millis:03d}"
+
+
+@functools.lru_cache(maxsize=None)
+def _render_circle_icon(size, fill, outline, outline_width):
+    """Rasterize a filled circular marker icon.
+    
+    The image only depends on the arguments, so each variant is drawn once per process.
+    """
+    image = Image.new('RGBA', (size, size), (0, 0, 0, 0))  # Transparent background
+    draw = ImageDraw.Draw(image)
+    
+    margin = 1
+    draw.ellipse([margin, margin, size-margin, size-margin],
+                 fill=fill, outline=outline, width=outline_width)
+    return image
+
+
+# Canvas items of a tkintermapview CanvasPositionMarker, and every name its delete() touches
+MARKER_CANVAS_ITEMS = ('polygon', 'big_circle', 'canvas_text', 'canvas_icon', 'canvas_image')
+MARKER_DELETE_NAMES = frozenset(MARKER_CANVAS_ITEMS + (
+    'map_widget', 'canvas_marker_list', 'canvas', 'remove', 'delete', 'update', 'deleted'))
+
+
+@functools.lru_cache(maxsize=None)
+def _can_batch_delete(marker_class):
+    """Whether markers of this class can be removed by deleting their canvas items directly.
+    
+    Only true if the class's own delete() does nothing beyond removing the marker from
+    the widget's list and deleting the MARKER_CANVAS_ITEMS, so a tkintermapview release
+    that adds canvas items or bookkeeping falls back to delete().
+    """
+    code = getattr(getattr(marker_class, 'delete', None), '__code__', None)
+    return code is not None and MARKER_DELETE_NAMES.issuperset(code.co_names)
+
+
+class TrailPoint:
+    """A single trail point as returned by TrailBuffer.point()."""
+    
+    __slots__ = ('lat', 'lon', 'speed_kph', 'heading', 'timestamp', 'index', 'targeting_info')
+    
+    def __init__(self, lat, lon, speed_kph, heading, timestamp, index, targeting_info):
+        self.lat = lat
+        self.lon = lon
+        self.speed_kph = speed_kph
+        self.heading = heading
+        self.timestamp = timestamp
+        self.index = index  # Chronological index in the trail when the point was read
+        self.targeting_info = targeting_info
+
+
+class TrailMarker:
+    """A pooled map marker together with the trail point it currently shows."""
+    
+    __slots__ = ('marker', 'data')
+    
+    def __init__(self, data, marker=None):
+        self.data = data
+        self.marker = marker
+
+
+class TrailBuffer:
+    """Fixed-capacity ring buffer holding the recent GPS trail as parallel NumPy arrays."""
+    
+    def __init__(self, capacity: int = 200):
+        self.capacity = capacity
+        self.lat = np.empty(capacity, dtype=np.float64)
+        self.lon = np.empty(capacity, dtype=np.float64)
+        self.speed_kph = np.empty(capacity, dtype=np.float64)
+        self.heading = np.empty(capacity, dtype=np.float64)
+        self.timestamp = np.empty(capacity, dtype=np.float64)
+        self.cos_lat = np.empty(capacity, dtype=np.float64)  # cos(lat) for distance queries
+        self.targeting_info = np.empty(capacity, dtype=object)
+        self.head = 0  # Slot the next point is written to
+        self.count = 0
+        self._reset_bounds()
+        
+    def _reset_bounds(self):
+        # Bounding box of every point appended since the last clear. Overwritten points
+        # are not removed from it, so it always encloses the points still held.
+        self.lat_min = self.lon_min = math.inf
+        self.lat_max = self.lon_max = -math.inf
+        
+    def __len__(self):
+        return self.count
+        
+    def append(self, lat, lon, speed_kph, heading, timestamp, targeting_info=None):
+        """Store a trail point, overwriting the oldest one once the buffer is full."""
+        head = self.head
+        self.lat[head] = lat
+        self.lon[head] = lon
+        self.speed_kph[head] = speed_kph
+        self.heading[head] = heading
+        self.timestamp[head] = timestamp
+        self.cos_lat[head] = math.cos(math.radians(lat))
+        self.targeting_info[head] = targeting_info
+        if lat < self.lat_min:
+            self.lat_min = lat
+        if lat > self.lat_max:
+            self.lat_max = lat
+        if lon < self.lon_min:
+            self.lon_min = lon
+        if lon > self.lon_max:
+            self.lon_max = lon
+        self.head = (head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+            
+    def clear(self):
+        self.head = 0
+        self.count = 0
+        self.targeting_info.fill(None)
+        self._reset_bounds()
+        
+    def _recent(self, array, n=None):
+        """Return the newest `n` values of `array` in chronological order."""
+        n = self.count if n is None else max(0, min(n, self.count))
+        start = (self.head - n) % self.capacity
+        if start + n <= self.capacity:
+            return array[start:start + n]
+        return np.concatenate((array[start:], array[:self.head]))
+        
+    def coords(self, n=None):
+        """Return the newest `n` points as a list of (lat, lon) tuples."""
+        return list(zip(self._recent(self.lat, n).tolist(), self._recent(self.lon, n).tolist()))
+        
+    def speeds(self, n=None):
+        """Return the speeds of the newest `n` points."""
+        return self._recent(self.speed_kph, n).tolist()
+        
+    def _slot(self, index: int):
+        """Map a chronological index (negative counts from the newest point) to a slot."""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("trail index out of range")
+        return index, (self.head - self.count + index) % self.capacity
+        
+    def coord(self, index: int):
+        """Return the trail point at a chronological index as a (lat, lon) tuple."""
+        slot = self._slot(index)[1]
+        return float(self.lat[slot]), float(self.lon[slot])
+        
+    def point(self, index: int) -> TrailPoint:
+        """Return the trail point at a chronological index."""
+        index, slot = self._slot(index)
+        return TrailPoint(
+            float(self.lat[slot]),
+            float(self.lon[slot]),
+            float(self.speed_kph[slot]),
+            float(self.heading[slot]),
+            float(self.timestamp[slot]),
+            index,
+            self.targeting_info[slot] or {}
+        )
+        
+    def nearest(self, lat, lon, n=None, max_distance_m=None):
+        """Find the point among the newest `n` that is closest to (lat, lon).
+        
+        Returns (chronological index, distance in meters), or None if no point
+        lies within `max_distance_m`.
+        """
+        if max_distance_m is not None:
+            # Degree window around the click; 111 km per degree is slightly short,
+            # which keeps the window on the wide side.
+            lat_window = max_distance_m / 111000
+            lon_window = lat_window / max(math.cos(math.radians(lat)), 1e-6)
+            # A click outside the whole trail's bounding box can't have a match
+            if (lat < self.lat_min - lat_window or lat > self.lat_max + lat_window or
+                    lon < self.lon_min - lon_window or lon > self.lon_max + lon_window):
+                return None
+                
+        # Search the backing arrays in slot order; the first `count` slots are exactly the
+        # stored points, so these are views and a wrapped ring never has to be stitched together
+        n = self.count if n is None else max(0, min(n, self.count))
+        lats = self.lat[:self.count]
+        lons = self.lon[:self.count]
+        
+        if max_distance_m is not None:
+            # Cheap degree window next so the trig only runs on nearby points
+            candidates = np.flatnonzero((np.abs(lats - lat) <= lat_window) & (np.abs(lons - lon) <= lon_window))
+        else:
+            candidates = np.arange(self.count)
+            
+        # Slot to chronological index, keeping only the newest `n` points
+        indices = (candidates - (self.head - self.count)) % self.capacity
+        in_window = indices >= self.count - n
+        candidates = candidates[in_window]
+        if not candidates.size:
+            return None
+        indices = indices[in_window]
+            
+        # Haversine with the stored cos(lat) of each point, so only the click's cosine is computed
+        deg = math.pi / 180
+        sin_dlat = np.sin((lats[candidates] - lat) * deg * 0.5)
+        sin_dlon = np.sin((lons[candidates] - lon) * deg * 0.5)
+        a = sin_dlat * sin_dlat + math.cos(lat * deg) * self.cos_lat[candidates] * sin_dlon * sin_dlon
+        distances = 2 * 6371000 * np.arcsin(np.sqrt(a))
+        best = int(np.argmin(distances))
+        if max_distance_m is not None and distances[best] >= max_distance_m:
+            return None
+        return int(indices[best]), float(distances[best])
+        
+    def points(self, n=None):
+        """Return the newest `n` points as TrailPoints, oldest first."""
+        n = self.count if n is None else max(0, min(n, self.count))
+        return [self.point(i) for i in range(self.count - n, self.count)]
+
+
+class NmeaBuffer:
+    """Fixed-capacity ring buffer of (timestamp, sentence) pairs packed into one bytearray.
+    
+    Timestamps are epoch seconds as returned by time.time(), kept to the millisecond
+    that format_nmea_timestamp shows. Each entry is stored ASCII-encoded as
+    "milliseconds<TAB>sentence" in a fixed-size slot,
+    which avoids keeping a tuple and two string objects alive per sentence. NMEA sentences
+    are at most 82 characters, so entries that don't fit a slot are rare; they are kept
+    aside as plain tuples.
+    """
+    
+    SLOT_SIZE = 96
+    _OVERSIZE = 255  # Length marker for entries kept in _oversize
+    
+    def __init__(self, maxlen: int = 1000):
+        self.maxlen = maxlen
+        self._data = bytearray(maxlen * self.SLOT_SIZE)
+        self._view = memoryview(self._data)
+        self._lengths = bytearray(maxlen)
+        self._oversize = {}
+        self._head = 0  # Slot the next entry is written to
+        self._count = 0
+        
+    def __len__(self):
+        return self._count
+        
+    def append(self, item):
+        """Store a (timestamp, sentence) pair, overwriting the oldest one once the buffer is full."""
+        timestamp, sentence = item
+        slot = self._head
+        self._oversize.pop(slot, None)
+        try:
+            record = f"{epoch_millis(timestamp)}\t{sentence}".encode('ascii')
+        except UnicodeEncodeError:
+            record = None
+            
+        if record is not None and len(record) <= self.SLOT_SIZE:
+            start = slot * self.SLOT_SIZE
+            self._data[start:start + len(record)] = record
+            self._lengths[slot] = len(record)
+        else:
+            self._oversize[slot] = (timestamp, sentence)
+            self._lengths[slot] = self._OVERSIZE
+            
+        self._head = (slot + 1) % self.maxlen
+        if self._count < self.maxlen:
+            self._count += 1
+            
+    def clear(self):
+        self._head = 0
+        self._count = 0
+        self._oversize.clear()
+        
+    def _read(self, slot):
+        length = self._lengths[slot]
+        if length == self._OVERSIZE:
+            return self._oversize[slot]
+        start = slot * self.SLOT_SIZE
+        millis, sentence = str(self._view[start:start + length], 'ascii').split('\t', 1)
+        return int(millis) / 1000, sentence
+        
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("NMEA buffer index out of range")
+        return self._read((self._head - self._count + index) % self.maxlen)
+        
+    def __iter__(self):
+        return iter(self.recent(self._count))
+        
+    def recent(self, n: int):
+        """Return the newest `n` entries, oldest first."""
+        n = max(0, min(n, self._count))
+        first = self._head - n
+        return [self._read((first + i) % self.maxlen) for i in range(n)]
+
 
 class EnhancedNMEAGUI:
     
@@ -61,21 +416,32 @@ class EnhancedNMEAGUI:
         # GUI state
         self.is_running = False
         self.current_targeting_mode = tk.StringVar(value="waypoint")
-        self.nmea_buffer = deque(maxlen=1000)  # Store last 1000 NMEA sentences
-        self.last_displayed_count = 0  # Track how many sentences we've already displayed
-        self.position_trail = deque(maxlen=200)  # Store positions for map (will be dynamically adjusted)
+        self.nmea_buffer = NmeaBuffer(maxlen=1000)  # Store last 1000 NMEA sentences
+        # Sentences handed from the update thread to the Tk thread. Appends and pops on a deque
+        # are atomic, and only the update thread drops entries, which keeps the count exact.
+        self.nmea_ingest_queue = deque(maxlen=NMEA_INGEST_LIMIT)
+        self.nmea_pending = deque(maxlen=1000)  # Buffered sentences not yet shown in the display
+        self.nmea_dropped_count = 0  # Oldest sentences dropped because the Tk thread fell behind
+        self.trail_buffer = TrailBuffer(capacity=200)  # Recent positions and per-point data for the map trail
         
         # Map performance optimizations
         self.map_update_pending = False
         self.last_map_update = 0
+        self.last_trail_redraw = 0  # Time of the last full trail redraw
         self._last_map_pos = None
+        self._last_map_error = None  # Last map update error whose traceback was printed
+        self.gui_queue = queue.SimpleQueue()  # (kind, *args) display updates from the update thread
+        self.redraw_pending = False  # A coalesced redraw of map, trail, NMEA panel and stats is scheduled
+        self.last_gui_redraw_ns = 0
+        self.min_gui_redraw_interval_ns = 100_000_000  # Coalesce data bursts into at most 10 redraws/sec
         self.trail_length = tk.IntVar(value=100)  # Initialize trail length control
         self.map_update_rate = tk.StringVar(value="Normal (2Hz)")  # Initialize update rate
         
         # Trail point markers and data storage
-        self.trail_markers = []  # Store trail point markers for interactivity
-        self.trail_data = deque(maxlen=200)  # Store detailed data for each trail point
-        self.trail_segments = []  # Store colored trail segments for speed visualization
+        self.trail_markers = deque()  # Pool of trail point markers for interactivity, oldest first
+        self.trail_markers_refresh_pending = False
+        self.trail_settings_after_id = None  # Pending debounced trail length change
+        self.trail_segments = deque()  # Store colored trail segments for speed visualization, oldest first
         self.show_trail_points = tk.BooleanVar(value=True)  # Show individual dots
         
         # Speed range tracking for color gradient
@@ -84,8 +450,7 @@ class EnhancedNMEAGUI:
         
         # Statistics tracking
         self.total_sentences_generated = 0
-        self.last_stats_update = time.time()
-        self.sentences_in_last_second = 0
+        self._last_text = {}  # Last text set on each status/statistics label variable
         
         # Threading
         self.gui_update_thread = None
@@ -99,6 +464,7 @@ class EnhancedNMEAGUI:
         self.setup_map()
         self.setup_nmea_panel()
         self.setup_status_bar()
+        self.setup_display_settings_cache()
         
         # Initial state
         self.update_targeting_controls()
@@ -108,8 +474,23 @@ class EnhancedNMEAGUI:
         self.load_circuit_by_name("Silverstone Circuit (Silverstone)")
         
         # Create custom trail marker icon
+        self._alternative_icons = {}
         self.trail_marker_icon = self.create_trail_marker_icon()
         
+        # Marker options shared by every trail point, chosen once instead of per marker
+        if self.trail_marker_icon:
+            # Use custom circle icon
+            self.trail_marker_style = {'icon': self.trail_marker_icon}
+        else:
+            # Fallback to text marker
+            self.trail_marker_style = {
+                'text': "•",  # Small dot character
+                'marker_color_circle': "orange",
+                'marker_color_outside': "darkorange",
+                'text_color': "white",
+                'font': ("Arial", 10)
+            }
+        
     def set_application_icon(self):
         """Set the application window and taskbar icon from the icon.png file."""
         try:
@@ -137,33 +518,10 @@ class EnhancedNMEAGUI:
         
     def create_trail_marker_icon(self):
         """Create a custom circle icon for trail markers."""
-        if not PIL_AVAILABLE:
-            return None
-            
         try:
-            # Create a small circular icon
-            size = 16  # Slightly larger for better visibility
-            image = Image.new('RGBA', (size, size), (0, 0, 0, 0))  # Transparent background
-            draw = ImageDraw.Draw(image)
-            
-            # Draw filled circle with gradient-like effect
-            margin = 1
-            # Outer circle (darker)
-            draw.ellipse([margin, margin, size-margin, size-margin], 
-                        fill=(255, 140, 0, 255),    # Orange fill
-                        outline=(200, 80, 0, 255),  # Darker orange outline
-                        width=2)
-            
-            # Inner highlight circle for 3D effect
-            highlight_margin = 3
-            draw.ellipse([highlight_margin, highlight_margin, size-highlight_margin, size-highlight_margin], 
-                        fill=(255, 200, 100, 180),  # Lighter orange center
-                        outline=None)
-            
-            # Convert to PhotoImage for tkinter
-            return ImageTk.PhotoImage(image)
-            
-        except Exception as e:
+            # Decoded by Tk itself, so PIL isn't needed to draw the icon
+            return tk.PhotoImage(data=TRAIL_MARKER_ICON_PNG)
+        except tk.TclError:
             return None
             
     def create_alternative_icon(self, color="orange"):
@@ -171,32 +529,15 @@ class EnhancedNMEAGUI:
         if not PIL_AVAILABLE:
             return None
             
-        try:
-            size = 14
-            image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(image)
-            
-            # Color mapping
-            colors = {
-                "orange": ((255, 140, 0, 255), (200, 80, 0, 255)),
-                "blue": ((0, 140, 255, 255), (0, 80, 200, 255)),
-                "green": ((140, 255, 0, 255), (80, 200, 0, 255)),
-                "red": ((255, 80, 80, 255), (200, 40, 40, 255))
-            }
-            
-            fill_color, outline_color = colors.get(color, colors["orange"])
-            
-            # Simple filled circle
-            draw.ellipse([1, 1, size-1, size-1], 
-                        fill=fill_color,
-                        outline=outline_color,
-                        width=1)
-            
-            return ImageTk.PhotoImage(image)
-            
-        except Exception as e:
-            print(f"Error creating {color} icon: {e}")
-            return None
+        # PhotoImages belong to this window's Tk interpreter, so they are cached per instance
+        if color not in ALTERNATIVE_ICON_COLORS:
+            color = "orange"
+        icon = self._alternative_icons.get(color)
+        if icon is None:
+            fill_color, outline_color = ALTERNATIVE_ICON_COLORS[color]
+            icon = ImageTk.PhotoImage(_render_circle_icon(14, fill_color, outline_color, 1))
+            self._alternative_icons[color] = icon
+        return icon
         
     def get_speed_range_from_targeting(self):
         """Get speed range from current targeting strategy or use defaults."""
@@ -280,6 +621,66 @@ class EnhancedNMEAGUI:
                 pass
         self.trail_segments.clear()
     
+    def setup_display_settings_cache(self):
+        """Mirror the display settings read on every redraw into a plain dict.
+        
+        Variable traces refresh the dict when a setting changes, so redraws don't
+        have to call into Tcl for each setting on every update.
+        """
+        self._display_settings = {}
+        for name in ('show_trail', 'show_trail_points', 'speed_color_enabled', 'trail_length', 'nmea_paused'):
+            var = getattr(self, name, None)
+            if var is None:
+                continue  # Map controls are missing when the map failed to load
+            var.trace_add('write', lambda *args, name=name, var=var: self.cache_display_setting(name, var))
+            self.cache_display_setting(name, var)
+            
+        # The map update rate is cached as the resolved interval in seconds
+        self.map_update_rate.trace_add('write', lambda *args: self.cache_map_update_interval())
+        self.cache_map_update_interval()
+            
+    def cache_display_setting(self, name, var):
+        """Store the current value of a display setting variable."""
+        try:
+            self._display_settings[name] = var.get()
+        except tk.TclError:
+            pass  # Keep the last valid value while the user is still typing
+            
+    def cache_map_update_interval(self):
+        """Resolve the map update rate setting into a minimum interval in seconds."""
+        try:
+            rate_setting = self.map_update_rate.get()
+            if "Fast" in rate_setting:
+                update_interval = 0.1  # 10Hz
+            elif "Normal" in rate_setting:
+                update_interval = 0.5  # 2Hz  
+            else:  # Slow
+                update_interval = 1.0  # 1Hz
+        except:
+            update_interval = 0.5  # Default fallback
+        self._display_settings['map_update_interval'] = update_interval
+            
+    def get_segment_color(self, speed_kph: float) -> str:
+        """Get the color for a trail segment ending at a point with the given speed."""
+        if self._display_settings['speed_color_enabled']:
+            return self.interpolate_color(speed_kph)
+        # Use classic blue color
+        return "blue"
+        
+    def draw_trail_segments(self, max_trail_points: int):
+        """Draw the whole trail as colored segments between consecutive points."""
+        trail_coords = self.trail_buffer.coords(max_trail_points)
+        trail_speeds = self.trail_buffer.speeds(max_trail_points)
+        
+        # Use speed from the second point of each pair for the segment color
+        for i in range(len(trail_coords) - 1):
+            segment_path = self.map_widget.set_path(
+                [trail_coords[i], trail_coords[i + 1]],
+                color=self.get_segment_color(trail_speeds[i + 1]),
+                width=3
+            )
+            self.trail_segments.append(segment_path)
+            
     def toggle_speed_colors(self):
         """Toggle speed-based trail coloring and refresh trail display."""
         # Force trail update by clearing segments
@@ -428,12 +829,27 @@ class EnhancedNMEAGUI:
         self.circle_angular_velocity = tk.DoubleVar(value=5.0)
         self.circle_clockwise = tk.BooleanVar(value=True)
         
+    def _rebuild_panel(self, frame, builder):
+        """Replace the widgets of a packed frame while it is unmapped.
+        
+        Taking the frame out of the layout while its children are destroyed and
+        recreated means geometry is only propagated once, when it is packed again.
+        """
+        pack_options = frame.pack_info()
+        frame.pack_forget()
+        try:
+            for widget in frame.winfo_children():
+                widget.destroy()
+            builder()
+        finally:
+            frame.pack(**pack_options)
+            
     def update_targeting_controls(self):
         """Update the parameter controls based on selected targeting mode."""
-        # Clear existing parameter widgets
-        for widget in self.param_frame.winfo_children():
-            widget.destroy()
-            
+        self._rebuild_panel(self.param_frame, self.create_targeting_controls)
+        
+    def create_targeting_controls(self):
+        """Create the parameter controls for the selected targeting mode."""
         mode = self.current_targeting_mode.get()
         
         if mode == "static":
@@ -448,17 +864,23 @@ class EnhancedNMEAGUI:
         elif mode == "waypoint":
             self.create_waypoint_controls()
             
+    def create_parameter_entries(self, specs):
+        """Create a labelled entry per (label, variable) pair, laid out in a single grid."""
+        frame = ttk.Frame(self.param_frame)
+        for row, (label, variable) in enumerate(specs):
+            ttk.Label(frame, text=label).grid(row=row, column=0, sticky=tk.W, padx=(0, 5))
+            ttk.Entry(frame, textvariable=variable, width=20).grid(row=row, column=1, sticky=tk.W, pady=(0, 5))
+        frame.pack(fill=tk.X)
+        return frame
+        
     def create_linear_controls(self):
         """Create controls for linear targeting."""
         # Target coordinates
-        ttk.Label(self.param_frame, text="Target Latitude:").pack(anchor=tk.W)
-        ttk.Entry(self.param_frame, textvariable=self.target_lat, width=20).pack(anchor=tk.W, pady=(0, 5))
-        
-        ttk.Label(self.param_frame, text="Target Longitude:").pack(anchor=tk.W)
-        ttk.Entry(self.param_frame, textvariable=self.target_lon, width=20).pack(anchor=tk.W, pady=(0, 5))
-        
-        ttk.Label(self.param_frame, text="Speed (km/h):").pack(anchor=tk.W)
-        ttk.Entry(self.param_frame, textvariable=self.target_speed, width=20).pack(anchor=tk.W, pady=(0, 5))
+        self.create_parameter_entries([
+            ("Target Latitude:", self.target_lat),
+            ("Target Longitude:", self.target_lon),
+            ("Speed (km/h):", self.target_speed)
+        ])
         
         # Set target from map button
         ttk.Button(self.param_frame, text="Set Target from Map", 
@@ -466,17 +888,12 @@ class EnhancedNMEAGUI:
                   
     def create_circular_controls(self):
         """Create controls for circular targeting."""
-        ttk.Label(self.param_frame, text="Center Latitude:").pack(anchor=tk.W)
-        ttk.Entry(self.param_frame, textvariable=self.circle_center_lat, width=20).pack(anchor=tk.W, pady=(0, 5))
-        
-        ttk.Label(self.param_frame, text="Center Longitude:").pack(anchor=tk.W)
-        ttk.Entry(self.param_frame, textvariable=self.circle_center_lon, width=20).pack(anchor=tk.W, pady=(0, 5))
-        
-        ttk.Label(self.param_frame, text="Radius (meters):").pack(anchor=tk.W)
-        ttk.Entry(self.param_frame, textvariable=self.circle_radius, width=20).pack(anchor=tk.W, pady=(0, 5))
-        
-        ttk.Label(self.param_frame, text="Angular Velocity (°/sec):").pack(anchor=tk.W)
-        ttk.Entry(self.param_frame, textvariable=self.circle_angular_velocity, width=20).pack(anchor=tk.W, pady=(0, 5))
+        self.create_parameter_entries([
+            ("Center Latitude:", self.circle_center_lat),
+            ("Center Longitude:", self.circle_center_lon),
+            ("Radius (meters):", self.circle_radius),
+            ("Angular Velocity (°/sec):", self.circle_angular_velocity)
+        ])
         
         ttk.Checkbutton(self.param_frame, text="Clockwise", variable=self.circle_clockwise).pack(anchor=tk.W)
         
@@ -493,8 +910,10 @@ class EnhancedNMEAGUI:
         circuit_select_frame.pack(fill='x', pady=(5, 0))
         
         self.circuit_var = tk.StringVar(value="Silverstone Circuit (Silverstone)")
+        # Circuits are listed when the dropdown is first opened, not while building the panel
         self.circuit_combo = ttk.Combobox(circuit_select_frame, textvariable=self.circuit_var, 
-                                         state="readonly", width=40)
+                                         state="readonly", width=40,
+                                         postcommand=self.populate_circuit_choices)
         self.circuit_combo.pack(side='left', fill='x', expand=True, padx=(0, 5))
         
         # Auto-load circuit when selection changes
@@ -504,16 +923,7 @@ class EnhancedNMEAGUI:
                                      command=self.load_selected_circuit)
         load_circuit_btn.pack(side='right')
         
-        # Load available circuits into combobox
-        try:
-            circuits = get_available_circuits()
-            circuit_values = [f"{name}" for circuit_id, name in circuits]
-            self.circuit_combo['values'] = circuit_values
-            # Store mapping from display names to IDs
-            self.circuit_id_map = {name: circuit_id for circuit_id, name in circuits}
-        except Exception as e:
-            print(f"Warning: Could not load F1 circuits: {e}")
-            self.circuit_id_map = {}
+        self.circuit_id_map = {}  # Filled on first use by populate_circuit_choices
         
         # Waypoint list
         ttk.Label(self.param_frame, text="Waypoints:").pack(anchor=tk.W, pady=(10, 0))
@@ -523,6 +933,7 @@ class EnhancedNMEAGUI:
         waypoint_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
         self.waypoint_listbox = tk.Listbox(waypoint_frame, height=6)
+        self._displayed_waypoints = []  # Rows currently shown in the listbox
         scrollbar = ttk.Scrollbar(waypoint_frame, orient=tk.VERTICAL, command=self.waypoint_listbox.yview)
         self.waypoint_listbox.config(yscrollcommand=scrollbar.set)
         
@@ -562,6 +973,22 @@ class EnhancedNMEAGUI:
         # Initialize UI state
         self._on_profile_selected()
         
+    def populate_circuit_choices(self):
+        """Load available circuits into the combobox the first time they are needed."""
+        if self.circuit_id_map:
+            return
+            
+        try:
+            circuit_values = []
+            circuit_id_map = {}  # Mapping from display names to IDs
+            for circuit_id, name in get_available_circuits():
+                circuit_values.append(name)
+                circuit_id_map[name] = circuit_id
+            self.circuit_combo['values'] = circuit_values
+            self.circuit_id_map = circuit_id_map
+        except Exception as e:
+            print(f"Warning: Could not load F1 circuits: {e}")
+            
     def _on_profile_selected(self, event=None):
         """Handle speed profile selection changes."""
         selected_profile = self.speed_profile_var.get()
@@ -606,17 +1033,13 @@ class EnhancedNMEAGUI:
         nmea_frame = ttk.LabelFrame(self.output_frame, text="NMEA Sentences", padding=10)
         nmea_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        self.nmea_sentences = {
-            'GGA': tk.BooleanVar(value=True),
-            'GLL': tk.BooleanVar(value=True),
-            'GSA': tk.BooleanVar(value=True),
-            'GSV': tk.BooleanVar(value=True),
-            'RMC': tk.BooleanVar(value=True),
-            'VTG': tk.BooleanVar(value=True),
-            'ZDA': tk.BooleanVar(value=True)
-        }
+        self.nmea_sentences = {name: tk.BooleanVar(value=True) for name in SENTENCE_BITS}
         
+        # Mirror the checkboxes into an integer bitmask so reading them needs no Tcl calls
+        self.sentence_mask = 0
         for sentence, var in self.nmea_sentences.items():
+            var.trace_add('write', lambda *args, sentence=sentence, var=var: self.update_sentence_mask(sentence, var))
+            self.update_sentence_mask(sentence, var)
             ttk.Checkbutton(nmea_frame, text=sentence, variable=var).pack(anchor=tk.W)
             
         # Update interval
@@ -627,6 +1050,21 @@ class EnhancedNMEAGUI:
         self.update_interval = tk.DoubleVar(value=1.0)
         ttk.Entry(interval_frame, textvariable=self.update_interval, width=10).pack(anchor=tk.W)
         
+    def update_sentence_mask(self, sentence, var):
+        """Set or clear the output mask bit for a sentence type from its checkbox."""
+        try:
+            enabled = var.get()
+        except tk.TclError:
+            return
+        if enabled:
+            self.sentence_mask |= SENTENCE_BITS[sentence]
+        else:
+            self.sentence_mask &= ~SENTENCE_BITS[sentence]
+            
+    def get_enabled_sentences(self):
+        """Get the enabled NMEA sentence types in output order."""
+        return _sentences_for_mask(self.sentence_mask)
+        
     def setup_map(self):
         """Create the interactive map panel."""
         # Map panel title
@@ -818,12 +1256,35 @@ class EnhancedNMEAGUI:
         ttk.Separator(self.status_frame, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=5)
         ttk.Label(self.status_frame, textvariable=self.status_logging).pack(side=tk.LEFT, padx=10)
         
-    def update_waypoint_list(self):
-        """Update the waypoint listbox display."""
+    def update_waypoint_list(self, start: Optional[int] = None):
+        """Update the waypoint listbox display.
+        
+        Callers that know the first waypoint they changed pass it as `start`, so only
+        the rows from there on are formatted; otherwise the rows are compared to find it.
+        """
         if hasattr(self, 'waypoint_listbox'):
-            self.waypoint_listbox.delete(0, tk.END)
-            for i, (lat, lon) in enumerate(self.waypoints):
-                self.waypoint_listbox.insert(tk.END, f"{i+1}: {lat:.6f}, {lon:.6f}")
+            displayed = self._displayed_waypoints
+            if start is not None:
+                keep = min(start, len(displayed), len(self.waypoints))
+                rows = displayed[:keep] + [f"{i+1}: {lat:.6f}, {lon:.6f}"
+                                           for i, (lat, lon) in enumerate(self.waypoints[keep:], keep)]
+            else:
+                rows = [f"{i+1}: {lat:.6f}, {lon:.6f}" for i, (lat, lon) in enumerate(self.waypoints)]
+                
+                # Keep the rows that are unchanged and only replace the ones after them,
+                # so appending a waypoint is a single insert instead of a full repopulate
+                keep = 0
+                for old_row, new_row in zip(displayed, rows):
+                    if old_row != new_row:
+                        break
+                    keep += 1
+                
+            if keep < len(displayed):
+                self.waypoint_listbox.delete(keep, tk.END)
+            if keep < len(rows):
+                # Listbox.insert takes any number of rows, so the tail goes over in one Tcl call
+                self.waypoint_listbox.insert(tk.END, *rows[keep:])
+            self._displayed_waypoints = rows
     
     def load_circuit_by_name(self, circuit_name: str):
         """Load a circuit by name during initialization."""
@@ -865,8 +1326,7 @@ class EnhancedNMEAGUI:
             self.gps.num_sats = self.num_sats.get()
             
             # Configure NMEA output
-            enabled_sentences = [name for name, var in self.nmea_sentences.items() if var.get()]
-            self.gps.output = tuple(enabled_sentences)
+            self.gps.output = self.get_enabled_sentences()
             
             # Set update interval
             self.simulator.interval = self.update_interval.get()
@@ -893,11 +1353,13 @@ class EnhancedNMEAGUI:
             elif mode == "waypoint":
                 # Determine speed mode and parameters
                 selected_profile = self.speed_profile_var.get()
+                # Defensive snapshot only; WaypointTargeting already copies the route into its own list
+                route = tuple(self.waypoints)
                 
                 if selected_profile == "Set Speed":
                     # Manual speed mode
                     targeting = WaypointTargeting(
-                        waypoints=self.waypoints,
+                        waypoints=route,
                         speed_kph=self.target_speed.get(),
                         loop=True,
                         mode='manual'
@@ -905,7 +1367,7 @@ class EnhancedNMEAGUI:
                 else:
                     # Dynamic speed mode with vehicle profile
                     targeting = WaypointTargeting(
-                        waypoints=self.waypoints,
+                        waypoints=route,
                         loop=True,
                         mode='dynamic',
                         speed_profile=selected_profile
@@ -919,7 +1381,6 @@ class EnhancedNMEAGUI:
                 print(f"Started automatic NMEA logging to: {log_filename}")
             
             # Start the simulator (non-blocking)
-            import io
             null_output = io.StringIO()  # Create a dummy output that doesn't print
             self.simulator.serve(output=null_output, blocking=False)
             
@@ -944,6 +1405,7 @@ class EnhancedNMEAGUI:
             self.simulator.kill()
             self.simulator.stop_auto_logging()  # Explicitly stop logging when stopping simulation
             self.stop_updates.set()
+            self.simulator.data_ready.set()  # Wake the update thread so it sees the stop flag promptly
             
             # Update UI state
             self.is_running = False
@@ -957,11 +1419,18 @@ class EnhancedNMEAGUI:
     def gui_update_loop(self):
         """Background thread for updating GUI with simulation data - optimized for performance with robust error handling."""
         last_sentence_count = 0
-        last_time = time.time()
-        update_counter = 0
+        last_stats_ns = time.monotonic_ns()  # Monotonic, so clock adjustments can't skew the rate
+        smoothed_rate = None
+        rate_smoothing = 0.5  # Weight of the newest one-second sample in the smoothed rate
+        last_status_ns = 0
+        status_interval_ns = 500_000_000  # Refresh the status bar at most twice a second
         sentences_this_second = 0
         consecutive_errors = 0
         max_consecutive_errors = 10  # Allow up to 10 consecutive errors before backing off
+        last_map_cell = None  # Quantized last position queued for the map
+        last_map_flush_ns = 0
+        map_cell_scale = 100000  # 1e-5 degree (~1 meter) cells, moves within a cell are skipped
+        map_max_interval_ns = 500_000_000  # Queue the position at least every 0.5 s even when static
         
         while not self.stop_updates.is_set():
             try:
@@ -979,11 +1448,11 @@ class EnhancedNMEAGUI:
                         # Get new sentences from stream (non-blocking)
                         new_sentences = self.simulator.get_new_sentences()
                         
-                        # Get current position data
-                        with self.simulator.lock:
-                            current_pos = (self.simulator.gps.lat, self.simulator.gps.lon)
-                            current_speed = self.simulator.gps.kph or 0.0
-                            current_heading = self.simulator.gps.heading or 0.0
+                        # Get current position data from the simulator's snapshot, no lock needed
+                        snapshot = self.simulator.latest
+                        if snapshot is not None:
+                            lat, lon, current_speed, current_heading = snapshot
+                            current_pos = (lat, lon)
                     except Exception as data_error:
                         print(f"Data access error (non-fatal): {data_error}")
                         # Continue with empty data rather than breaking the loop
@@ -992,61 +1461,79 @@ class EnhancedNMEAGUI:
                     # Update NMEA buffer - sentences are already timestamped from stream
                     sentence_count_this_update = len(new_sentences)
                     
-                    # Safe buffer update
+                    # Hand the sentences to the Tk thread, which moves them into the buffer
                     try:
-                        for timestamp, sentence in new_sentences:
-                            self.nmea_buffer.append((timestamp, sentence))
-                            self.total_sentences_generated += 1
+                        ingest = self.nmea_ingest_queue
+                        if len(new_sentences) > NMEA_INGEST_LIMIT:
+                            self.nmea_dropped_count += len(new_sentences) - NMEA_INGEST_LIMIT
+                            new_sentences = new_sentences[-NMEA_INGEST_LIMIT:]
+                        # Make room by dropping the oldest waiting sentences, so the display
+                        # keeps up with the newest data when the Tk thread falls behind
+                        for _ in range(len(ingest) + len(new_sentences) - NMEA_INGEST_LIMIT):
+                            try:
+                                ingest.popleft()
+                            except IndexError:
+                                break  # The Tk thread drained it meanwhile
+                            self.nmea_dropped_count += 1
+                        ingest.extend(new_sentences)
+                        self.total_sentences_generated += sentence_count_this_update
                     except Exception as buffer_error:
                         print(f"Buffer update error (non-fatal): {buffer_error}")
                     
                     sentences_this_second += sentence_count_this_update
                     
-                    # Schedule GUI updates on main thread with reduced frequency
-                    update_counter += 1
+                    # Queue GUI updates for the main thread with reduced frequency
+                    notify_gui = False
                     
-                    # Safe GUI update scheduling with individual error handling
-                    # Always update NMEA display (it's fast)
-                    if new_sentences:  # Only if there are new sentences
-                        try:
-                            self.root.after(0, self.safe_update_nmea_display)
-                        except Exception as nmea_error:
-                            print(f"NMEA display scheduling error (non-fatal): {nmea_error}")
-                    
-                    # Update map less frequently to reduce lag
-                    if update_counter % 2 == 0 and current_pos[0] is not None and current_pos[1] is not None:
-                        try:
-                            self.root.after(0, self.safe_update_map_position, current_pos[0], current_pos[1])
-                        except Exception as map_error:
-                            print(f"Map update scheduling error (non-fatal): {map_error}")
+                    if new_sentences and current_pos[0] is not None and current_pos[1] is not None:
+                        # Skip the map update until the position has moved to another ~1 meter cell
+                        now_ns = time.monotonic_ns()
+                        map_cell = (int(current_pos[0] * map_cell_scale), int(current_pos[1] * map_cell_scale))
+                        if map_cell != last_map_cell or now_ns - last_map_flush_ns >= map_max_interval_ns:
+                            self.gui_queue.put(("map", current_pos))
+                            notify_gui = True
+                            last_map_cell = map_cell
+                            last_map_flush_ns = now_ns
                     
                     # Update status bar even less frequently
-                    if update_counter % 5 == 0:
-                        try:
-                            self.root.after(0, self.safe_update_status_bar, current_pos, current_speed)
-                        except Exception as status_error:
-                            print(f"Status update scheduling error (non-fatal): {status_error}")
+                    now_ns = time.monotonic_ns()
+                    if now_ns - last_status_ns >= status_interval_ns:
+                        self.gui_queue.put(("status", current_pos, current_speed))
+                        notify_gui = True
+                        last_status_ns = now_ns
                     
                     # Calculate sentence rate every second
-                    current_time = time.time()
-                    if current_time - last_time >= 1.0:  # Update every second
+                    elapsed_ns = now_ns - last_stats_ns
+                    if elapsed_ns >= 1_000_000_000:  # Update every second
                         try:
                             # Use sentences generated in this second, not buffer length
-                            rate = sentences_this_second / (current_time - last_time)
+                            rate = sentences_this_second * 1e9 / elapsed_ns
+                            if smoothed_rate is None:
+                                smoothed_rate = rate
+                            else:
+                                smoothed_rate += rate_smoothing * (rate - smoothed_rate)
                             
                             # Update GUI on main thread
-                            self.root.after(0, self.safe_update_statistics, self.total_sentences_generated, rate)
-                            
-                            # Reset for next second
-                            sentences_this_second = 0
-                            last_time = current_time
+                            self.gui_queue.put(("stats", self.total_sentences_generated, smoothed_rate))
+                            notify_gui = True
                         except Exception as stats_error:
                             print(f"Statistics update error (non-fatal): {stats_error}")
-                            # Reset counters even if stats update failed
-                            sentences_this_second = 0
-                            last_time = current_time
+                            
+                        # Reset for next second, even if the stats update failed
+                        sentences_this_second = 0
+                        last_stats_ns = now_ns
                         
-                time.sleep(0.1)  # Update at 10Hz, but with intelligent throttling
+                    # Wake the main thread once for everything queued this iteration
+                    if notify_gui:
+                        try:
+                            self.root.event_generate("<<NMEAData>>", when="tail")
+                        except Exception as event_error:
+                            print(f"GUI update event error (non-fatal): {event_error}")
+                        
+                # Sleep until the simulator publishes new data, waking regularly for housekeeping
+                data_ready = self.simulator.data_ready
+                if data_ready.wait(0.5):
+                    data_ready.clear()
                 
             except Exception as e:
                 consecutive_errors += 1
@@ -1096,23 +1583,82 @@ class EnhancedNMEAGUI:
             print(f"Statistics update failed (non-fatal): {e}")
             # Continue gracefully
                 
+    def _set_if_changed(self, var, text):
+        """Set a label variable only if its text changed, as every set() redraws the label."""
+        name = str(var)  # Tk variables aren't hashable, key the shadow copy by Tcl name
+        if self._last_text.get(name) != text:
+            self._last_text[name] = text
+            var.set(text)
+            
     def update_statistics(self, total_count, rate):
         """Update statistics display on main thread."""
         try:
-            self.sentences_count.set(f"Sentences: {total_count}")
-            self.sentences_per_sec.set(f"Rate: {rate:.1f}/sec")
+            self._set_if_changed(self.sentences_count, f"Sentences: {total_count}")
+            self._set_if_changed(self.sentences_per_sec, f"Rate: {rate:.1f}/sec")
         except Exception as e:
             print(f"Statistics update error: {e}")
     
     def schedule_gui_updates(self):
-        """Schedule periodic GUI updates - statistics now handled by background thread."""
-        # Statistics are now handled by the gui_update_loop background thread
-        # This method can be used for other periodic updates if needed
-        self.root.after(1000, self.schedule_gui_updates)  # Keep running for consistency
+        """Apply display updates whenever the update thread signals that some are queued."""
+        self.root.bind("<<NMEAData>>", self.on_nmea_data)
+        
+    def on_nmea_data(self, event=None):
+        """Coalesce update events into at most one redraw per redraw interval."""
+        if self.redraw_pending:
+            return  # A redraw is already scheduled and will pick up this data too
+            
+        wait_ns = self.last_gui_redraw_ns + self.min_gui_redraw_interval_ns - time.monotonic_ns()
+        if wait_ns > 0:
+            self.redraw_pending = True
+            self.root.after(max(1, wait_ns // 1_000_000), self.redraw_gui_data)
+        else:
+            self.redraw_gui_data()
+            
+    def redraw_gui_data(self):
+        """Show the buffered NMEA sentences and apply the newest queued display updates."""
+        self.redraw_pending = False
+        self.last_gui_redraw_ns = time.monotonic_ns()
+        
+        if self.drain_nmea_queue():
+            # More sentences are waiting, pick them up in the next redraw
+            self.root.after_idle(self.on_nmea_data)
+        self.safe_update_nmea_display()
+        
+        # Only the newest update of each kind matters, older ones are superseded
+        latest = {}
+        try:
+            while True:
+                update = self.gui_queue.get_nowait()
+                latest[update[0]] = update[1:]
+        except queue.Empty:
+            pass
+            
+        if "map" in latest:
+            lat, lon = latest["map"][0]
+            if lat is not None and lon is not None:
+                self.safe_update_map_position(lat, lon)
+        if "status" in latest:
+            self.safe_update_status_bar(*latest["status"])
+        if "stats" in latest:
+            self.safe_update_statistics(*latest["stats"])
+            
+    def drain_nmea_queue(self):
+        """Move queued sentences into the NMEA buffer; returns True if some are left over."""
+        drained = 0
+        popleft = self.nmea_ingest_queue.popleft
+        try:
+            while drained < MAX_NMEA_DRAIN:
+                entry = popleft()
+                self.nmea_buffer.append(entry)
+                self.nmea_pending.append(entry)
+                drained += 1
+        except IndexError:
+            pass
+        return drained == MAX_NMEA_DRAIN
         
     def update_nmea_display(self):
         """Update the NMEA data display with robust error handling."""
-        if self.nmea_paused.get():
+        if self._display_settings['nmea_paused']:
             return
             
         # Add new sentences to display
@@ -1122,45 +1668,48 @@ class EnhancedNMEAGUI:
         try:
             self.nmea_text.config(state=tk.NORMAL)
             
-            # Only display new sentences since last update
-            buffer_len = len(self.nmea_buffer)
-            
-            if buffer_len > self.last_displayed_count:
-                # Get only the new sentences
-                new_sentences = list(self.nmea_buffer)[self.last_displayed_count:]
-                
-                # Clear the text widget periodically to prevent memory issues (with safer handling)
+            # Only display sentences buffered since the last update
+            if self.nmea_pending:
+                # Trim the text widget periodically to prevent memory issues (with safer handling)
                 try:
                     current_lines = int(self.nmea_text.index('end-1c').split('.')[0])
-                    if current_lines > 1000:  # If more than 1000 lines, clear and keep recent
-                        self.nmea_text.delete('1.0', 'end')
-                        # Reset counter since we cleared the display
-                        self.last_displayed_count = max(0, buffer_len - 500)
-                        new_sentences = list(self.nmea_buffer)[self.last_displayed_count:]
+                    if current_lines > 1000:  # If more than 1000 lines, keep only the recent 500
+                        self.nmea_text.delete('1.0', f'{current_lines - 500}.0')
                 except (tk.TclError, ValueError, IndexError) as clear_error:
                     print(f"Text widget clear error (non-fatal): {clear_error}")
                     # If clearing fails, just continue with the update
                     
-                # Display only new sentences
-                for timestamp, sentence in new_sentences:
-                    try:
-                        # Validate sentence data before display
-                        if not isinstance(sentence, str) or not sentence.strip():
-                            continue
-                            
-                        # Add timestamp for display only (not for export)
-                        self.nmea_text.insert(tk.END, f"[{timestamp}] ", "timestamp")
-                        
-                        # Add sentence with appropriate color
-                        sentence_type = sentence.split(',')[0][3:6] if len(sentence) > 6 else "UNK"
-                        self.nmea_text.insert(tk.END, f"{sentence}\n", sentence_type)
+                # Build the whole batch first so Tk only lays out the widget once per update
+                lines = []
+                line_tags = []
+                while self.nmea_pending:
+                    timestamp, sentence = self.nmea_pending.popleft()
+                    # Validate sentence data before display
+                    if not isinstance(sentence, str) or not sentence.strip():
+                        continue
                         
-                    except (tk.TclError, IndexError, AttributeError) as sentence_error:
-                        print(f"Individual sentence display error (non-fatal): {sentence_error}")
-                        continue  # Skip this sentence but continue with others
+                    # Add timestamp for display only (not for export)
+                    prefix = f"[{format_nmea_timestamp(timestamp)}] "
+                    # "$GPGGA,..." -> "GGA" without splitting the whole sentence on commas
+                    sentence_type = sentence[3:6] if len(sentence) >= 6 else "UNK"
+                    lines.append(prefix + sentence)
+                    line_tags.append((len(prefix), sentence_type))
                     
-                # Update our counter
-                self.last_displayed_count = buffer_len
+                if lines:
+                    try:
+                        start_line = int(self.nmea_text.index('end-1c').split('.')[0])
+                        self.nmea_text.insert(tk.END, "\n".join(lines) + "\n")
+                        
+                        # Collect the ranges for each tag so every tag is applied with one call
+                        tag_ranges = {"timestamp": []}
+                        for offset, (prefix_len, sentence_type) in enumerate(line_tags):
+                            line = start_line + offset
+                            tag_ranges["timestamp"].extend((f"{line}.0", f"{line}.{prefix_len}"))
+                            tag_ranges.setdefault(sentence_type, []).extend((f"{line}.{prefix_len}", f"{line}.end"))
+                        for tag, ranges in tag_ranges.items():
+                            self.nmea_text.tag_add(tag, *ranges)
+                    except (tk.TclError, ValueError) as insert_error:
+                        print(f"Sentence display error (non-fatal): {insert_error}")
                 
             # Auto-scroll to bottom (with error handling)
             try:
@@ -1187,20 +1736,8 @@ class EnhancedNMEAGUI:
             print(f"Warning: Invalid coordinates - lat: {lat}, lon: {lon}")
             return
             
-        # Get update rate setting
-        try:
-            rate_setting = self.map_update_rate.get()
-            if "Fast" in rate_setting:
-                update_interval = 0.1  # 10Hz
-            elif "Normal" in rate_setting:
-                update_interval = 0.5  # 2Hz  
-            else:  # Slow
-                update_interval = 1.0  # 1Hz
-        except:
-            update_interval = 0.5  # Default fallback
-            
         # Throttle map updates to prevent lag
-        if current_time - self.last_map_update < update_interval:
+        if current_time - self.last_map_update < self._display_settings['map_update_interval']:
             return
             
         self.last_map_update = current_time
@@ -1209,17 +1746,7 @@ class EnhancedNMEAGUI:
             try:
                 # Update GPS marker position efficiently
                 if hasattr(self, 'gps_marker'):
-                    # Only update if position changed significantly (reduce unnecessary updates)
-                    if hasattr(self, '_last_map_pos') and self._last_map_pos is not None:
-                        try:
-                            last_lat, last_lon = self._last_map_pos
-                            # Only update if moved more than ~1 meter (rough calculation)
-                            if abs(lat - last_lat) < 0.00001 and abs(lon - last_lon) < 0.00001:
-                                return
-                        except (TypeError, ValueError) as e:
-                            print(f"Position comparison error: {e}")
-                            # Continue with update anyway
-                    
+                    # Insignificant moves are already filtered out by the update thread
                     self.gps_marker.set_position(lat, lon)
                     self._last_map_pos = (lat, lon)
                 else:
@@ -1230,7 +1757,6 @@ class EnhancedNMEAGUI:
                             marker_color_outside="darkred", text_color="white"
                         )
                         self._last_map_pos = (lat, lon)
-                        # print(f"Created GPS marker at {lat:.6f}, {lon:.6f}")
                     except Exception as e:
                         print(f"Failed to create GPS marker: {e}")
                         return
@@ -1243,79 +1769,53 @@ class EnhancedNMEAGUI:
                     with self.simulator.lock:
                         current_speed = self.simulator.gps.kph or 0.0
                         current_heading = self.simulator.gps.heading or 0.0
-                        targeting_status = self.simulator.get_targeting_status()
+                        # The targeting status is only shown in trail marker popups
+                        if self._display_settings['show_trail_points']:
+                            targeting_status = self.simulator.get_targeting_status()
+                        else:
+                            targeting_status = None
                 except:
                     current_speed = 0.0
                     current_heading = 0.0
                     targeting_status = {}
                 
                 # Store detailed trail data
-                trail_point_data = {
-                    'lat': lat,
-                    'lon': lon,
-                    'speed_kph': current_speed,
-                    'heading': current_heading,
-                    'timestamp': current_time,
-                    'index': len(self.trail_data),
-                    'targeting_info': targeting_status
-                }
-                
-                self.position_trail.append((lat, lon))
-                self.trail_data.append(trail_point_data)
+                self.trail_buffer.append(lat, lon, current_speed, current_heading,
+                                         current_time, targeting_status)
                 
                 # Update trail visualization if enabled
-                if self.show_trail.get() and len(self.position_trail) > 1:
+                if self._display_settings['show_trail'] and len(self.trail_buffer) > 1:
                     try:
-                        # More frequent trail updates for better visibility
-                        if (len(self.position_trail) % 2 == 0 or  # Every 2 points
-                            not hasattr(self, 'trail_segments') or len(self.trail_segments) == 0):     # Or if no trail exists
+                        # Draw colored trail segments with user-controlled length
+                        max_trail_points = self._display_settings['trail_length']
                             
-                            # Update speed range for color calculations
-                            self.update_speed_range()
+                        if not self.trail_segments:
+                            # No trail drawn yet (or it was cleared) - draw it in full, but at most
+                            # once a second so bursts of setting changes cause a single redraw
+                            if current_time - self.last_trail_redraw >= 1.0:
+                                self.last_trail_redraw = current_time
+                                self.update_speed_range()
+                                self.draw_trail_segments(max_trail_points)
+                        else:
+                            # Extend the existing trail by one segment instead of redrawing it
+                            segment_path = self.map_widget.set_path(
+                                [self.trail_buffer.coord(-2), self.trail_buffer.coord(-1)],
+                                color=self.get_segment_color(current_speed),
+                                width=3
+                            )
+                            self.trail_segments.append(segment_path)
                             
-                            # Clear old trail segments
-                            self.clear_trail_segments()
-                                    
-                            # Draw new colored trail segments with user-controlled length
-                            try:
-                                max_trail_points = self.trail_length.get()
-                            except:
-                                max_trail_points = 50  # fallback
+                            # Drop segments that have fallen off the end of the trail
+                            while len(self.trail_segments) > max(1, max_trail_points - 1):
+                                self.trail_segments.popleft().delete()
                                 
-                            trail_coords = list(self.position_trail)[-max_trail_points:]
-                            trail_speeds = [data['speed_kph'] for data in list(self.trail_data)[-max_trail_points:]]
-                            
-                            # Create colored segments between consecutive points
-                            if len(trail_coords) >= 2 and len(trail_speeds) >= 2:
-                                try:
-                                    for i in range(len(trail_coords) - 1):
-                                        # Choose color based on speed color toggle
-                                        if self.speed_color_enabled.get():
-                                            # Use speed from the second point for segment color
-                                            segment_speed = trail_speeds[i + 1] if i + 1 < len(trail_speeds) else trail_speeds[i]
-                                            segment_color = self.interpolate_color(segment_speed)
-                                        else:
-                                            # Use classic blue color
-                                            segment_color = "blue"
-                                        
-                                        # Create segment between two consecutive points
-                                        segment_path = self.map_widget.set_path(
-                                            [trail_coords[i], trail_coords[i + 1]], 
-                                            color=segment_color, 
-                                            width=3
-                                        )
-                                        self.trail_segments.append(segment_path)
-                                    
-                                    # Add interactive trail point markers using alternative approach
-                                    self.create_trail_point_markers_alternative()
-                                    
-                                except Exception as e:
-                                    pass  # Silently handle trail drawing errors
+                        # Move the interactive trail point markers along with the trail
+                        self.advance_trail_markers()
                                     
                     except Exception as e:
                         pass  # Silently handle trail update errors
                         
-                elif not self.show_trail.get() and hasattr(self, 'trail_segments'):
+                elif not self._display_settings['show_trail'] and hasattr(self, 'trail_segments'):
                     # Hide trail if disabled
                     try:
                         self.clear_trail_segments()
@@ -1325,8 +1825,10 @@ class EnhancedNMEAGUI:
                         
             except Exception as e:
                 print(f"Map update error: {e}")
-                import traceback
-                traceback.print_exc()
+                # Only dump the stack the first time, a broken map can fail on every update
+                if repr(e) != self._last_map_error:
+                    self._last_map_error = repr(e)
+                    traceback.print_exc()
         else:
             # Fallback text display
             if hasattr(self, 'position_display'):
@@ -1344,8 +1846,8 @@ class EnhancedNMEAGUI:
     def update_status_bar(self, position, speed):
         """Update the status bar with current information."""
         lat, lon = position
-        self.status_position.set(f"Position: {lat:.6f}, {lon:.6f}")
-        self.status_speed.set(f"Speed: {speed:.1f} km/h")
+        self._set_if_changed(self.status_position, f"Position: {lat:.6f}, {lon:.6f}")
+        self._set_if_changed(self.status_speed, f"Speed: {speed:.1f} km/h")
         
         # Update action status for dynamic waypoint targeting
         targeting = self.simulator.get_targeting()
@@ -1362,24 +1864,24 @@ class EnhancedNMEAGUI:
                 
                 # Standardize message format to consistent length
                 if action_type == 'ACCEL':
-                    self.status_action.set(f"Action: Accelerating {percentage:4.1f}% - Full throttle ahead")
+                    self._set_if_changed(self.status_action, f"Action: Accelerating {percentage:4.1f}% - Full throttle ahead")
                 else:  # BRAKE
-                    self.status_action.set(f"Action: Braking hard {percentage:4.1f}% - Corner approach")
+                    self._set_if_changed(self.status_action, f"Action: Braking hard {percentage:4.1f}% - Corner approach")
             else:
-                self.status_action.set("Action: Maintaining speed - Steady pace cruise")
+                self._set_if_changed(self.status_action, "Action: Maintaining speed - Steady pace cruise")
         else:
-            self.status_action.set("Action: Manual control   - Driver input mode")
+            self._set_if_changed(self.status_action, "Action: Manual control   - Driver input mode")
         
         mode = self.current_targeting_mode.get().title()
-        self.status_mode.set(f"Mode: {mode}")
+        self._set_if_changed(self.status_mode, f"Mode: {mode}")
         
         # Update logging status
         log_filename = self.simulator.get_log_filename()
         if log_filename:
             log_name = os.path.basename(log_filename)
-            self.status_logging.set(f"Logging: {log_name}")
+            self._set_if_changed(self.status_logging, f"Logging: {log_name}")
         else:
-            self.status_logging.set("Logging: Inactive")
+            self._set_if_changed(self.status_logging, "Logging: Inactive")
         
         # Note: Sentence count and rate updated by update_statistics method
         
@@ -1406,8 +1908,8 @@ class EnhancedNMEAGUI:
     def clear_trail(self):
         """Clear the GPS position trail for better performance."""
         try:
-            self.position_trail.clear()
-            self.trail_data.clear()
+            self.trail_buffer.clear()
+            self.clear_trail_segments()
             self.clear_trail_markers()
             
             if hasattr(self, 'trail_path'):
@@ -1418,14 +1920,23 @@ class EnhancedNMEAGUI:
             pass  # Silently handle trail clearing errors
             
     def update_trail_settings(self):
-        """Update trail settings when user changes trail length."""
+        """Update trail settings when user changes trail length, once the spinbox settles."""
+        # Each spinbox click fires this, so only apply the last change of a burst
+        if self.trail_settings_after_id is not None:
+            self.root.after_cancel(self.trail_settings_after_id)
+        self.trail_settings_after_id = self.root.after(200, self.apply_trail_settings)
+        
+    def apply_trail_settings(self):
+        """Redraw the trail with the current trail length.
+        
+        The trail buffer keeps its full capacity and every reader takes only the newest
+        trail_length points, so the stored points are left alone.
+        """
+        self.trail_settings_after_id = None
         try:
-            new_length = self.trail_length.get()
-            # Adjust the deque maxlen by recreating it
-            current_trail = list(self.position_trail)
-            self.position_trail = deque(current_trail[-new_length:], maxlen=max(200, new_length))
-            
             # Force redraw trail with new length
+            self.clear_trail_segments()
+            self.schedule_trail_markers_refresh()
             if hasattr(self, 'trail_path'):
                 self.trail_path.delete()
                 delattr(self, 'trail_path')
@@ -1439,7 +1950,7 @@ class EnhancedNMEAGUI:
             if self.show_trail.get():
                 print("Trail visibility enabled")
                 # Force redraw trail if we have positions
-                if len(self.position_trail) > 1:
+                if len(self.trail_buffer) > 1:
                     self.redraw_trail()
             else:
                 print("Trail visibility disabled")
@@ -1454,26 +1965,26 @@ class EnhancedNMEAGUI:
     def redraw_trail(self):
         """Force redraw the trail with current settings."""
         try:
-            if not self.show_trail.get() or len(self.position_trail) < 2:
+            if not self.show_trail.get() or len(self.trail_buffer) < 2:
                 return
                 
-            # Remove existing trail
-            if hasattr(self, 'trail_path'):
-                self.trail_path.delete()
-                delattr(self, 'trail_path')
-                
             # Get trail coordinates
             max_trail_points = self.trail_length.get()
-            trail_coords = list(self.position_trail)[-max_trail_points:]
+            trail_coords = self.trail_buffer.coords(max_trail_points)
             
             if len(trail_coords) >= 2 and MAP_AVAILABLE and hasattr(self, 'map_widget'):
-                self.trail_path = self.map_widget.set_path(
-                    trail_coords, color="blue", width=3
-                )
-                print(f"Redrawn trail with {len(trail_coords)} points")
+                if hasattr(self, 'trail_path') and hasattr(self.trail_path, 'set_position_list'):
+                    # Move the existing path instead of deleting and recreating it
+                    self.trail_path.set_position_list(trail_coords)
+                else:
+                    if hasattr(self, 'trail_path'):
+                        self.trail_path.delete()
+                    self.trail_path = self.map_widget.set_path(
+                        trail_coords, color="blue", width=3
+                    )
                 
                 # Update trail markers
-                self.create_trail_point_markers_alternative()
+                self.schedule_trail_markers_refresh()
                 
         except Exception as e:
             print(f"Error redrawing trail: {e}")
@@ -1487,41 +1998,29 @@ class EnhancedNMEAGUI:
             # Remove existing trail markers
             self.clear_trail_markers()
             
-            if not self.show_trail_points.get() or len(self.trail_data) < 2:
+            if not self.show_trail_points.get() or len(self.trail_buffer) < 2:
                 return
                 
             # Get trail points to display
             max_trail_points = self.trail_length.get()
-            trail_points = list(self.trail_data)[-max_trail_points:]
+            trail_points = self.trail_buffer.points(max_trail_points)
             
             # Create small clickable markers for each trail point
             for i, point_data in enumerate(trail_points):
-                try:
-                    # Create a small marker for each point - no text to keep them small
-                    marker = self.map_widget.set_marker(
-                        point_data['lat'], point_data['lon'],
-                        text="",  # No text to make them small dots
-                        marker_color_circle="orange",
-                        marker_color_outside=""
-                    )
-                    
-                    # Store marker with associated data
-                    marker_info = {
-                        'marker': marker,
-                        'data': point_data,
-                        'index': i
-                    }
-                    self.trail_markers.append(marker_info)
-                    
-                    # Bind click event using tkinter binding on the marker's canvas item
-                    # We'll use a different approach - store the data and check clicks
-                    marker._data = point_data  # Store data directly on marker
-                    
-                except Exception as e:
-                    print(f"Error creating marker {i}: {e}")
-                    continue
+                # Create a small marker for each point - no text to keep them small
+                marker = self.map_widget.set_marker(
+                    point_data.lat, point_data.lon,
+                    text="",  # No text to make them small dots
+                    marker_color_circle="orange",
+                    marker_color_outside=""
+                )
+                
+                # Store marker with associated data
+                self.trail_markers.append(TrailMarker(point_data, marker))
                 
-            print(f"Created {len(self.trail_markers)} interactive trail point markers")
+                # Bind click event using tkinter binding on the marker's canvas item
+                # We'll use a different approach - store the data and check clicks
+                marker._data = point_data  # Store data directly on marker
             
             # Set up click detection for the map
             self.setup_map_click_detection()
@@ -1550,92 +2049,131 @@ class EnhancedNMEAGUI:
             
             # Check if click is near any trail marker
             for marker_info in self.trail_markers:
-                marker = marker_info['marker']
+                marker = marker_info.marker
                 
                 # Get marker position on canvas (approximate)
-                try:
-                    # This is a rough approximation - we'll check if click is close to marker
-                    marker_lat = marker_info['data']['lat']
-                    marker_lon = marker_info['data']['lon']
-                    
-                    # Convert marker position to canvas coordinates (this is approximate)
-                    # Since we can't easily get exact canvas coords, we'll use a different approach
-                    # We'll show info for the closest marker to click
-                    
-                    # For now, let's use a simple distance-based approach
-                    # This is a simplified implementation
-                    pass
-                    
-                except Exception as e:
-                    print(f"Error checking marker click: {e}")
-                    continue
+                # This is a rough approximation - we'll check if click is close to marker
+                marker_lat = marker_info.data.lat
+                marker_lon = marker_info.data.lon
+                
+                # Convert marker position to canvas coordinates (this is approximate)
+                # Since we can't easily get exact canvas coords, we'll use a different approach
+                # We'll show info for the closest marker to click
+                
+                # For now, let's use a simple distance-based approach
+                # This is a simplified implementation
                     
         except Exception as e:
             print(f"Error handling map click: {e}")
             
+    def create_trail_point_marker(self, point_data):
+        """Create a clickable marker for a trail point and return its marker info."""
+        marker_info = TrailMarker(point_data)
+        
+        # Create marker with the shared trail marker style and command callback
+        marker_info.marker = self.map_widget.set_marker(
+            point_data.lat, point_data.lon,
+            command=self.on_pooled_trail_marker_click,
+            data=marker_info,
+            **self.trail_marker_style
+        )
+        return marker_info
+        
+    def schedule_trail_markers_refresh(self):
+        """Place the trail markers once Tk is idle, so repeated requests are handled in one pass."""
+        if self.trail_markers_refresh_pending:
+            return
+        self.trail_markers_refresh_pending = True
+        self.root.after_idle(self.refresh_trail_markers)
+        
+    def refresh_trail_markers(self):
+        """Run a scheduled trail marker refresh."""
+        self.trail_markers_refresh_pending = False
+        self.create_trail_point_markers_alternative()
+        
     def create_trail_point_markers_alternative(self):
-        """Create clickable markers for trail points using the correct command parameter."""
+        """Place clickable markers on all displayed trail points, reusing existing markers."""
         try:
-            # Remove existing trail markers
-            self.clear_trail_markers()
-            
-            if not self.show_trail_points.get() or len(self.trail_data) < 2:
+            if not self._display_settings['show_trail_points'] or len(self.trail_buffer) < 2:
+                self.clear_trail_markers()
                 return
                 
             # Get trail points to display  
-            max_trail_points = self.trail_length.get()
-            trail_points = list(self.trail_data)[-max_trail_points:]
-            
-            # Create clickable markers for trail points
-            for i, point_data in enumerate(trail_points):
-                try:
-                    # Create marker with custom icon and command callback
-                    if self.trail_marker_icon and PIL_AVAILABLE:
-                        # Use custom circle icon
-                        marker = self.map_widget.set_marker(
-                            point_data['lat'], point_data['lon'],
-                            icon=self.trail_marker_icon,
-                            command=lambda marker_obj, data=point_data, idx=i: self.on_trail_marker_click(marker_obj, data, idx)
-                        )
-                       # print(f"Created custom icon marker {i}")
-                    else:
-                        # Fallback to text marker
-                        marker_text = f"•"  # Small dot character
-                        marker = self.map_widget.set_marker(
-                            point_data['lat'], point_data['lon'],
-                            text=marker_text,
-                            marker_color_circle="orange",
-                            marker_color_outside="darkorange",
-                            text_color="white",
-                            font=("Arial", 10),
-                            command=lambda marker_obj, data=point_data, idx=i: self.on_trail_marker_click(marker_obj, data, idx)
-                        )
-                       #  print(f"Created fallback text marker {i}")
-                    
-                    # Store marker info
-                    self.trail_markers.append({
-                        'marker': marker,
-                        'data': point_data,
-                        'index': i
-                    })
+            max_trail_points = self._display_settings['trail_length']
+            trail_points = self.trail_buffer.points(max_trail_points)
+            
+            # Only delete the markers that are no longer needed
+            surplus = []
+            while len(self.trail_markers) > len(trail_points):
+                surplus.append(self.trail_markers.pop().marker)
+            self.delete_markers(surplus)
                     
-                 #   print(f"Created clickable marker {i} at {point_data['lat']:.6f}, {point_data['lon']:.6f}")
-                    
-                except Exception as e:
-                    pass  # Silently handle individual marker creation errors
-                    continue
+            for i, point_data in enumerate(trail_points):
+                if i < len(self.trail_markers):
+                    # Move an existing marker instead of deleting and recreating it
+                    marker_info = self.trail_markers[i]
+                    marker_info.marker.set_position(point_data.lat, point_data.lon)
+                    marker_info.data = point_data
+                else:
+                    self.trail_markers.append(self.create_trail_point_marker(point_data))
                     
-          #  print(f"Created {len(self.trail_markers)} clickable trail point markers")
-            
         except Exception as e:
             print(f"Error creating trail point markers: {e}")
             
+    def advance_trail_markers(self):
+        """Add a marker for the newest trail point, recycling the oldest marker once the trail is full."""
+        try:
+            if not self._display_settings['show_trail_points'] or len(self.trail_buffer) < 2:
+                return
+                
+            max_trail_points = self._display_settings['trail_length']
+            
+            # The markers must end at the point before the new one, otherwise place them all again
+            if (not self.trail_markers or
+                    self.trail_markers[-1].data.timestamp != self.trail_buffer.point(-2).timestamp):
+                self.schedule_trail_markers_refresh()
+                return
+                
+            point_data = self.trail_buffer.point(-1)
+            if len(self.trail_markers) >= max_trail_points:
+                marker_info = self.trail_markers.popleft()
+                marker_info.marker.set_position(point_data.lat, point_data.lon)
+                marker_info.data = point_data
+                self.trail_markers.append(marker_info)
+            else:
+                self.trail_markers.append(self.create_trail_point_marker(point_data))
+                
+            # Drop surplus markers if the trail length was reduced
+            surplus = []
+            while len(self.trail_markers) > max_trail_points:
+                surplus.append(self.trail_markers.popleft().marker)
+            self.delete_markers(surplus)
+                    
+        except Exception as e:
+            print(f"Error updating trail point markers: {e}")
+            
+    def on_pooled_trail_marker_click(self, marker_obj):
+        """Resolve a clicked trail marker to the point it currently shows."""
+        marker_info = marker_obj.data
+        try:
+            index = self.trail_markers.index(marker_info)
+        except ValueError:
+            return  # Marker was removed from the trail
+            
+        # Markers end at the newest trail point, so refresh the point's position in the trail
+        point_data = marker_info.data
+        try:
+            point_data = self.trail_buffer.point(len(self.trail_buffer) - len(self.trail_markers) + index)
+        except IndexError:
+            pass
+        self.on_trail_marker_click(marker_obj, point_data, index)
+        
     def on_trail_marker_click(self, marker_obj, point_data, index):
         """Handle clicks on trail point markers."""
         try:
             print(f"Trail marker {index} clicked!")
             print(f"Marker position: {marker_obj.position}")
-            print(f"Point data: lat={point_data['lat']:.6f}, lon={point_data['lon']:.6f}")
+            print(f"Point data: lat={point_data.lat:.6f}, lon={point_data.lon:.6f}")
             
             # Show the detailed information popup
             self.show_point_info(point_data)
@@ -1666,23 +2204,12 @@ class EnhancedNMEAGUI:
                 
             click_lat, click_lon = coordinates
             
-            # Find the nearest trail point
-            min_distance = float('inf')
-            nearest_point = None
-            
-            for marker_info in self.trail_markers:
-                point_data = marker_info['data']
-                distance = self.calculate_distance_between_points(
-                    click_lat, click_lon,
-                    point_data['lat'], point_data['lon']
-                )
-                
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_point = point_data
+            # Find the nearest trail point among the ones that have markers
+            nearest = self.trail_buffer.nearest(click_lat, click_lon, len(self.trail_markers),
+                                                max_distance_m=100)  # Within 100 meters
                     
-            if nearest_point and min_distance < 100:  # Within 100 meters
-                self.show_point_info(nearest_point)
+            if nearest is not None:
+                self.show_point_info(self.trail_buffer.point(nearest[0]))
             else:
                 messagebox.showinfo("No Data", f"No trail points within 100m of click location")
                 
@@ -1701,12 +2228,12 @@ class EnhancedNMEAGUI:
     def test_trail_point_info(self):
         """Test method to show info for the latest trail point."""
         try:
-            if not self.trail_data:
+            if not len(self.trail_buffer):
                 messagebox.showinfo("No Data", "No trail points available yet. Start simulation first!")
                 return
                 
             # Show info for the most recent trail point
-            latest_point = list(self.trail_data)[-1]
+            latest_point = self.trail_buffer.point(-1)
             print("Testing trail point info with latest point...")
             self.show_point_info(latest_point)
             
@@ -1717,21 +2244,47 @@ class EnhancedNMEAGUI:
     def clear_trail_markers(self):
         """Clear all trail point markers."""
         try:
-            for marker_info in self.trail_markers:
-                try:
-                    marker_info['marker'].delete()
-                except:
-                    pass
+            self.delete_markers([marker_info.marker for marker_info in self.trail_markers])
             self.trail_markers.clear()
         except Exception as e:
             print(f"Error clearing trail markers: {e}")
             
+    def delete_markers(self, markers):
+        """Delete map markers, removing all their canvas items with a single call.
+        
+        CanvasPositionMarker.delete() flushes the canvas with update() for every
+        marker, which stalls the GUI when a whole trail of markers is removed.
+        """
+        if not markers:
+            return
+            
+        marker_list = getattr(self.map_widget, 'canvas_marker_list', None)
+        item_ids = []
+        deleted = set()
+        for marker in markers:
+            if not isinstance(marker_list, list) or not _can_batch_delete(type(marker)):
+                marker.delete()  # Internals we don't know, let the marker delete itself
+                continue
+            for name in MARKER_CANVAS_ITEMS:
+                item = getattr(marker, name)
+                if item is not None:
+                    item_ids.append(item)
+                setattr(marker, name, None)
+            marker.deleted = True
+            deleted.add(id(marker))
+            
+        if not deleted:
+            return
+        marker_list[:] = [marker for marker in marker_list if id(marker) not in deleted]
+        if item_ids:
+            self.map_widget.canvas.delete(*item_ids)
+            
     def toggle_trail_points(self):
         """Toggle trail point markers visibility."""
         try:
             if self.show_trail_points.get():
                 print("Trail points enabled")
-                self.create_trail_point_markers_alternative()
+                self.schedule_trail_markers_refresh()
             else:
                 print("Trail points disabled")
                 self.clear_trail_markers()
@@ -1740,63 +2293,52 @@ class EnhancedNMEAGUI:
             
     def calculate_distance_between_points(self, lat1, lon1, lat2, lon2):
         """Calculate distance between two GPS points in meters."""
-        import math
-        
-        # Convert to radians
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-        
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-        c = 2 * math.asin(math.sqrt(a))
+        # Haversine formula, scaling degrees to radians directly instead of via map()
+        deg = math.pi / 180
+        sin_dlat = math.sin((lat2 - lat1) * deg * 0.5)
+        sin_dlon = math.sin((lon2 - lon1) * deg * 0.5)
+        a = sin_dlat * sin_dlat + math.cos(lat1 * deg) * math.cos(lat2 * deg) * sin_dlon * sin_dlon
         
         # Earth's radius in meters
-        earth_radius = 6371000
-        return earth_radius * c
+        return 2 * 6371000 * math.asin(math.sqrt(a))
         
     def show_point_info(self, point_data):
         """Show detailed information about a trail point."""
         try:
             # Calculate distances to previous and next points
-            point_index = point_data['index']
+            point_index = point_data.index
             
-            # Find previous and next points
+            # Find previous and next points (only their coordinates are needed).
+            # Adjacent trail samples are close together, so the flat-earth distance is enough.
             prev_distance = next_distance = "N/A"
-            prev_point = next_point = None
             
-            trail_list = list(self.trail_data)
             if point_index > 0:
-                prev_point = trail_list[point_index - 1]
-                prev_distance = self.calculate_distance_between_points(
-                    point_data['lat'], point_data['lon'],
-                    prev_point['lat'], prev_point['lon']
+                prev_lat, prev_lon = self.trail_buffer.coord(point_index - 1)
+                prev_distance = _small_distance_m(
+                    point_data.lat, point_data.lon, prev_lat, prev_lon
                 )
                 prev_distance = f"{prev_distance:.1f}m"
                 
-            if point_index < len(trail_list) - 1:
-                next_point = trail_list[point_index + 1]
-                next_distance = self.calculate_distance_between_points(
-                    point_data['lat'], point_data['lon'],
-                    next_point['lat'], next_point['lon']
+            if point_index < len(self.trail_buffer) - 1:
+                next_lat, next_lon = self.trail_buffer.coord(point_index + 1)
+                next_distance = _small_distance_m(
+                    point_data.lat, point_data.lon, next_lat, next_lon
                 )
                 next_distance = f"{next_distance:.1f}m"
             
             # Format timestamp
-            from datetime import datetime
-            timestamp = datetime.fromtimestamp(point_data['timestamp'])
-            time_str = timestamp.strftime("%H:%M:%S.%f")[:-3]
+            time_str = format_nmea_timestamp(point_data.timestamp)
             
             # Create info message
-            info_text = f"""Trail Point #{point_data['index'] + 1}
+            info_text = f"""Trail Point #{point_data.index + 1}
             
 📍 Position:
-   Latitude: {point_data['lat']:.6f}°
-   Longitude: {point_data['lon']:.6f}°
+   Latitude: {point_data.lat:.6f}°
+   Longitude: {point_data.lon:.6f}°
 
 🏎️ Motion Data:
-   Speed: {point_data['speed_kph']:.1f} km/h
-   Heading: {point_data['heading']:.1f}°
+   Speed: {point_data.speed_kph:.1f} km/h
+   Heading: {point_data.heading:.1f}°
    
 📏 Distances:
    To Previous: {prev_distance}
@@ -1804,10 +2346,10 @@ class EnhancedNMEAGUI:
    
 ⏰ Time: {time_str}
 
-🎯 Targeting Mode: {point_data.get('targeting_info', {}).get('type', 'Unknown')}"""
+🎯 Targeting Mode: {point_data.targeting_info.get('type', 'Unknown')}"""
 
             # Show info dialog
-            messagebox.showinfo(f"Trail Point #{point_data['index'] + 1}", info_text)
+            messagebox.showinfo(f"Trail Point #{point_data.index + 1}", info_text)
             
         except Exception as e:
             print(f"Error showing point info: {e}")
@@ -1817,20 +2359,10 @@ class EnhancedNMEAGUI:
         """Change the map layer/tile server with better error handling."""
         if MAP_AVAILABLE and hasattr(self, 'map_widget'):
             try:
-                layer = self.map_layer.get()
-                if layer == "OpenStreetMap":
-                    # Use OpenStreetMap tiles with multiple servers for better reliability
-                    self.map_widget.set_tile_server("https://a.tile.openstreetmap.org/{z}/{x}/{y}.png")
-                elif layer == "Google normal":
-                    # Google Maps normal view
-                    self.map_widget.set_tile_server("https://mt1.google.com/vt/lyrs=m&x={x}&y={y}&z={z}")
-                elif layer == "Google satellite":
-                    # Google Maps satellite view
-                    self.map_widget.set_tile_server("https://mt1.google.com/vt/lyrs=s&x={x}&y={y}&z={z}")
-                    
-                # Force a small refresh by slightly adjusting the view
-                current_pos = self.map_widget.get_position()
-                self.map_widget.set_position(current_pos[0], current_pos[1])
+                tile_server = MAP_TILE_SERVERS.get(self.map_layer.get())
+                if tile_server is not None:
+                    # set_tile_server clears the tile cache and redraws the view itself
+                    self.map_widget.set_tile_server(tile_server)
                 
             except Exception as e:
                 print(f"Map layer change error: {e}")
@@ -1853,7 +2385,7 @@ class EnhancedNMEAGUI:
         if self.current_targeting_mode.get() == "waypoint":
             lat, lon = coordinates
             self.waypoints.append((lat, lon))
-            self.update_waypoint_list()
+            self.update_waypoint_list(len(self.waypoints) - 1)
             messagebox.showinfo("Waypoint Added", f"Added waypoint at {lat:.6f}, {lon:.6f}")
             
     def set_target_from_map(self):
@@ -1867,7 +2399,7 @@ class EnhancedNMEAGUI:
         if dialog.result:
             lat, lon = dialog.result
             self.waypoints.append((lat, lon))
-            self.update_waypoint_list()
+            self.update_waypoint_list(len(self.waypoints) - 1)
             
     def remove_waypoint(self):
         """Remove selected waypoint."""
@@ -1877,12 +2409,13 @@ class EnhancedNMEAGUI:
                 index = selection[0]
                 if 0 <= index < len(self.waypoints):
                     self.waypoints.pop(index)
-                    self.update_waypoint_list()
+                    self.update_waypoint_list(index)
     
     def load_selected_circuit(self):
         """Load the selected F1 circuit into waypoints."""
         try:
             selected_name = self.circuit_var.get()
+            self.populate_circuit_choices()
             
             if not selected_name or selected_name not in self.circuit_id_map:
                 messagebox.showwarning("No Circuit Selected", "Please select an F1 circuit first.")
@@ -1945,7 +2478,7 @@ class EnhancedNMEAGUI:
             try:
                 config = self.get_current_config()
                 with open(filename, 'w') as f:
-                    json.dump(config, f, indent=2)
+                    json.dump(config, f, **self.json_dump_options())
                 messagebox.showinfo("Success", "Configuration saved successfully!")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save configuration: {e}")
@@ -1963,10 +2496,15 @@ class EnhancedNMEAGUI:
                         data = json.load(f)
                         self.waypoints = data.get('waypoints', [])
                 elif filename.endswith('.csv'):
-                    import csv
-                    with open(filename, 'r') as f:
-                        reader = csv.reader(f)
-                        self.waypoints = [(float(row[0]), float(row[1])) for row in reader if len(row) >= 2]
+                    try:
+                        # Parse the whole file in C; this handles plain lat,lon files
+                        rows = np.loadtxt(filename, delimiter=',', usecols=(0, 1), ndmin=2)
+                        self.waypoints = [tuple(row) for row in rows.tolist()]
+                    except (ValueError, IndexError):
+                        # Ragged rows (e.g. short lines) - fall back to skipping them one by one
+                        with open(filename, 'r') as f:
+                            reader = csv.reader(f)
+                            self.waypoints = [(float(row[0]), float(row[1])) for row in reader if len(row) >= 2]
                         
                 self.update_waypoint_list()
                 messagebox.showinfo("Success", f"Imported {len(self.waypoints)} waypoints!")
@@ -1988,12 +2526,12 @@ class EnhancedNMEAGUI:
             try:
                 if filename.endswith('.json'):
                     with open(filename, 'w') as f:
-                        json.dump({'waypoints': self.waypoints}, f, indent=2)
+                        json.dump({'waypoints': self.waypoints}, f, **self.json_dump_options())
                 elif filename.endswith('.csv'):
-                    import csv
+                    # Same output as csv.writer (shortest round-trip repr, CRLF rows), built as
+                    # one string and written in a single call instead of a writer call per row
                     with open(filename, 'w', newline='') as f:
-                        writer = csv.writer(f)
-                        writer.writerows(self.waypoints)
+                        f.write(''.join(f"{lat},{lon}\r\n" for lat, lon in self.waypoints))
                         
                 messagebox.showinfo("Success", "Waypoints exported successfully!")
             except Exception as e:
@@ -2027,7 +2565,6 @@ class EnhancedNMEAGUI:
             return
         
         # Generate timestamp-based filename
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         default_filename = f"nmea_buffer_export_{timestamp}.nmea"
             
@@ -2039,17 +2576,17 @@ class EnhancedNMEAGUI:
         )
         if filename:
             try:
-                with open(filename, 'w') as f:
-                    for timestamp, sentence in self.nmea_buffer:
-                        # Export only the NMEA sentence, no timestamp
-                        f.write(f"{sentence}\n")
-                messagebox.showinfo("Success", f"NMEA buffer data exported successfully!\n{len(self.nmea_buffer)} sentences exported.")
+                # Export only the NMEA sentence, no timestamp. The buffer is only filled
+                # on this (Tk) thread, so it can be read directly without a snapshot
+                sentences = [sentence for timestamp, sentence in self.nmea_buffer]
+                with open(filename, 'w', buffering=65536) as f:
+                    f.write("\n".join(sentences) + "\n")
+                messagebox.showinfo("Success", f"NMEA buffer data exported successfully!\n{len(sentences)} sentences exported.")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export NMEA data: {e}")
     
     def _export_log_file(self, log_filename):
         """Export/copy the current auto-log file."""
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         default_filename = f"nmea_export_{timestamp}.nmea"
         
@@ -2062,12 +2599,12 @@ class EnhancedNMEAGUI:
         
         if filename:
             try:
-                import shutil
                 shutil.copy2(log_filename, filename)
                 
-                # Count lines in the exported file
-                with open(filename, 'r') as f:
-                    line_count = sum(1 for _ in f)
+                # Count lines in the exported file, reading it in large binary chunks
+                # since auto-logs of long sessions hold hundreds of thousands of lines
+                with open(filename, 'rb') as f:
+                    line_count = sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
                 
                 messagebox.showinfo("Success", 
                     f"NMEA log file exported successfully!\n" +
@@ -2090,9 +2627,6 @@ class EnhancedNMEAGUI:
             
         try:
             # Open the folder and select the file
-            import subprocess
-            import platform
-            
             if platform.system() == "Windows":
                 subprocess.run(["explorer", "/select,", os.path.abspath(log_filename)])
             elif platform.system() == "Darwin":  # macOS
@@ -2107,12 +2641,20 @@ class EnhancedNMEAGUI:
     def clear_nmea_buffer(self):
         """Clear the NMEA data buffer and display."""
         self.nmea_buffer.clear()
+        self.nmea_pending.clear()
         if hasattr(self, 'nmea_text'):
             self.nmea_text.config(state=tk.NORMAL)
             self.nmea_text.delete(1.0, tk.END)
             self.nmea_text.config(state=tk.DISABLED)
             
     # Utility methods
+    def json_dump_options(self):
+        """Indent JSON files for readability unless they hold a long waypoint list."""
+        if len(self.waypoints) > COMPACT_JSON_WAYPOINTS:
+            # The compact form stays on the C encoder and keeps large routes small
+            return {'separators': (',', ':')}
+        return {'indent': 2}
+        
     def get_current_config(self):
         """Get current configuration as dictionary."""
         return {
@@ -2197,7 +2739,7 @@ class EnhancedNMEAGUI:
             # Check for recent data
             recent_data = "No recent data"
             if self.nmea_buffer:
-                last_timestamp_str = self.nmea_buffer[-1][0]  # Get timestamp string
+                last_timestamp_str = format_nmea_timestamp(self.nmea_buffer[-1][0])
                 recent_data = f"Last data: {last_timestamp_str}"
             
             # Check stream status
@@ -2223,7 +2765,9 @@ class EnhancedNMEAGUI:
    • Buffer size: {buffer_size} sentences
    • Total sentences generated: {self.total_sentences_generated}
    • {recent_data}
-   • Last displayed count: {self.last_displayed_count}
+   • Pending display: {len(self.nmea_pending)} sentences
+   • Waiting for display: {len(self.nmea_ingest_queue)} sentences
+   • Dropped (display behind): {self.nmea_dropped_count}
    • {stream_status}
    
 📁 Auto Logging:
@@ -2327,6 +2871,24 @@ class WaypointDialog:
         self.dialog.destroy()
 
 
+# Waypoints of the built-in F1 circuit presets, shared by every PresetDialog
+F1_CIRCUIT_PRESETS = {
+    "Silverstone": (
+        (52.0786, -1.0169), (52.0798, -1.0158), (52.0823, -1.0142),
+        (52.0847, -1.0167), (52.0855, -1.0201), (52.0834, -1.0223),
+        (52.0803, -1.0235), (52.0775, -1.0198), (52.0761, -1.0164), (52.0769, -1.0138)
+    ),
+    "Monaco": (
+        (43.7347, 7.4205), (43.7342, 7.4198), (43.7338, 7.4195),
+        (43.7335, 7.4201), (43.7340, 7.4210), (43.7345, 7.4208)
+    ),
+    "Spa-Francorchamps": (
+        (50.4371, 5.9701), (50.4380, 5.9720), (50.4390, 5.9740),
+        (50.4385, 5.9760), (50.4375, 5.9750), (50.4365, 5.9720)
+    ),
+}
+
+
 class PresetDialog:
     """Dialog for selecting F1 circuit presets."""
     
@@ -2340,22 +2902,7 @@ class PresetDialog:
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
-        # F1 circuit presets
-        self.circuits = {
-            "Silverstone": [
-                (52.0786, -1.0169), (52.0798, -1.0158), (52.0823, -1.0142),
-                (52.0847, -1.0167), (52.0855, -1.0201), (52.0834, -1.0223),
-                (52.0803, -1.0235), (52.0775, -1.0198), (52.0761, -1.0164), (52.0769, -1.0138)
-            ],
-            "Monaco": [
-                (43.7347, 7.4205), (43.7342, 7.4198), (43.7338, 7.4195),
-                (43.7335, 7.4201), (43.7340, 7.4210), (43.7345, 7.4208)
-            ],
-            "Spa-Francorchamps": [
-                (50.4371, 5.9701), (50.4380, 5.9720), (50.4390, 5.9740),
-                (50.4385, 5.9760), (50.4375, 5.9750), (50.4365, 5.9720)
-            ]
-        }
+        self.circuits = F1_CIRCUIT_PRESETS
         
         # Circuit list
         ttk.Label(self.dialog, text="Select F1 Circuit:", font=('Arial', 12, 'bold')).pack(pady=10)
@@ -2375,11 +2922,11 @@ class PresetDialog:
     def load_circuit(self):
         selection = self.circuit_listbox.curselection()
         if selection:
-            circuit_name = list(self.circuits.keys())[selection[0]]
+            circuit_name = self.circuit_listbox.get(selection[0])
             waypoints = self.circuits[circuit_name]
             
-            # Load waypoints into GUI
-            self.gui.waypoints = waypoints
+            # Load waypoints into GUI; the GUI edits its list in place, so it gets its own copy
+            self.gui.waypoints = list(waypoints)
             self.gui.current_targeting_mode.set("waypoint")
             self.gui.update_targeting_controls()
             self.gui.update_waypoint_list()
@@ -2400,7 +2947,6 @@ def main():
         app.run()
     except Exception as e:
         print(f"Failed to start GUI: {e}")
-        import traceback
         traceback.print_exc()
 
 
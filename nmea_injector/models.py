@@ -17,6 +17,8 @@ class Satellite(object):
     """  class for a GNSS satellite
     """
 
+    __slots__ = ('prn', 'elevation', 'azimuth', 'snr')
+
     def __init__(self, prn, elevation=0, azimuth=0, snr=40):
         self.prn = prn
         self.elevation = elevation
@@ -186,8 +188,10 @@ class GnssReceiver(object):
         if self.date_time is None:
             return ""
 
-        result = self.__utc.strftime("%H%M%S")
-        fractional = self.__utc.strftime("%f")[:self.time_dp]
+        # Plain integer formatting; same output as strftime("%H%M%S") and "%f"
+        utc = self.__utc
+        result = f"{utc.hour:02d}{utc.minute:02d}{utc.second:02d}"
+        fractional = f"{utc.microsecond:06d}"[:self.time_dp]
         if not fractional:
             return result
         return ".".join([result, fractional])
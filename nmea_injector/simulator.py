@@ -1,13 +1,24 @@
 import datetime
+import io
 import math
+import os
 import threading
 import time
+import traceback
+from collections import deque
+from itertools import chain
 from random import random
 from sys import stdout
 from typing import Optional
 
 from . import models
-from .targeting import TargetingStrategy, StaticTargeting
+from .targeting import TargetingStrategy, StaticTargeting, LinearTargeting
+
+# Satellite drift applied per step, indexed by the receiver clock's second
+SATELLITE_PERTURBATION = tuple(math.sin(second * math.pi / 30) / 2 for second in range(60))
+
+# Shortest wait between output ticks, so a zero or tiny interval can't spin the worker
+MIN_TICK_WAIT = 0.1
 
 
 class Simulator(object):
@@ -19,7 +30,7 @@ class Simulator(object):
     and advanced targeting modes (linear, circular, waypoint).
     '''
 
-    def __init__(self, gps=None, glonass=None, static=False, heading_variation=45):
+    def __init__(self, gps=None, glonass=None, static=False, heading_variation=45, stream_limit=10000):
         ''' 
         Initialise the  GPS simulator instance.
         
@@ -28,18 +39,22 @@ class Simulator(object):
             glonass: Glonass receiver model instance (optional)
             static: If True, GPS position remains static
             heading_variation: Maximum random heading variation in degrees
+            stream_limit: Most sentences kept for get_new_sentences(); older ones are dropped
         '''
         self.__worker = None
         self.__run = threading.Event()
+        self.__stop = threading.Event()  # Set by kill() to wake the worker from its pacing wait
         self.lock = threading.Lock()  # Initialize lock first
         
         # Stream-based data collection for GUI
-        self._sentence_stream = []  # Buffer for new sentences since last read
-        self._stream_lock = threading.Lock()  # Separate lock for stream operations
+        self._sentence_stream = deque(maxlen=stream_limit)  # Buffer for new sentences since last read
+        self._stream_lock = threading.Lock()  # Guards the auto-log descriptor against a concurrent close
+        self.latest = None  # (lat, lon, kph, heading) snapshot, replaced as a whole so readers need no lock
+        self.data_ready = threading.Event()  # Set whenever new sentences or a new snapshot are available
         
         # Automatic file logging
         self._auto_log_file = None
-        self._log_file_handle = None
+        self._log_fd = None  # Raw file descriptor, written with one os.write per batch
         
         if gps is None:
             gps = models.GpsReceiver()
@@ -93,7 +108,6 @@ class Simulator(object):
         """Legacy property setter - converts to LinearTargeting for compatibility."""
         self._target = value
         if value is not None:
-            from .targeting import LinearTargeting
             lat, lon = value
             linear_targeting = LinearTargeting(
                 target_lat=lat, 
@@ -114,28 +128,32 @@ class Simulator(object):
         
         Should be called while under lock conditions.
         '''
-        if self.static and self._targeting_strategy is None:
+        strategy = self._targeting_strategy
+        if self.static and strategy is None:
             return
 
-        duration_hrs = duration / 3600.0
+        # Loop invariants, looked up once per step rather than per receiver
+        time_step = datetime.timedelta(seconds=duration)
+        heading_variation = self.heading_variation
 
         # Update satellite perturbations (same as original)
         for gnss in self.gnss:
             if gnss.date_time is not None and (
                     gnss.num_sats > 0 or gnss.has_rtc):
-                gnss.date_time += datetime.timedelta(seconds=duration)
+                gnss.date_time += time_step
 
-            perturbation = math.sin(gnss.date_time.second * math.pi / 30) / 2
+            perturbation = SATELLITE_PERTURBATION[gnss.date_time.second]
             for satellite in gnss.satellites:
                 satellite.snr += perturbation
                 satellite.elevation += perturbation
                 satellite.azimuth += perturbation
 
             #  GPS movement using targeting strategies
-            if gnss.has_fix and self._targeting_strategy is not None:
-                if self._targeting_strategy.is_active():
+            if gnss.has_fix and strategy is not None:
+                active = strategy.is_active()
+                if active:
                     # Get next position from targeting strategy
-                    new_lat, new_lon, new_heading, new_speed = self._targeting_strategy.get_next_position(
+                    new_lat, new_lon, new_heading, new_speed = strategy.get_next_position(
                         current_lat=gnss.lat or 0.0,
                         current_lon=gnss.lon or 0.0,
                         current_heading=gnss.heading or 0.0,
@@ -149,57 +167,103 @@ class Simulator(object):
                     gnss.heading = new_heading
                     gnss.kph = new_speed
                     
-                    # Apply heading variation if specified
-                    if self.heading_variation and gnss.heading is not None:
-                        rand_heading = (random() - 0.5) * self.heading_variation
-                        gnss.heading = (gnss.heading + rand_heading) % 360
-                        
-                else:
-                    # Targeting strategy is inactive - apply legacy random walk
-                    if self.heading_variation and gnss.heading is not None:
-                        rand_heading = (random() - 0.5) * self.heading_variation
-                        gnss.heading = (gnss.heading + rand_heading) % 360
+                # Apply heading variation if specified; after targeting, or before the
+                # legacy random walk move when the targeting strategy is inactive
+                if heading_variation and gnss.heading is not None:
+                    gnss.heading = (gnss.heading + (random() - 0.5) * heading_variation) % 360
+                    
+                if not active:
                     gnss.move(duration)
 
-    def __write(self, output, sentence, delimiter):
-        string = f'{sentence}{delimiter}'
-        try:
-            output.write(string)
-        except TypeError:
-            output.write(string.encode())
+    def __publish_state(self):
+        ''' Replace the position snapshot read by the GUI. Should be called while under lock conditions.
+        '''
+        self.latest = (self.gps.lat, self.gps.lon, self.gps.kph or 0.0, self.gps.heading or 0.0)
+        self.data_ready.set()
+
+    def __collect_output(self):
+        ''' Current NMEA sentences of all receivers as one list. Should be called while under lock conditions.
+        '''
+        if len(self.gnss) == 1:
+            return self.gnss[0].get_output()  # Already a fresh list, no need to copy it
+        return list(chain.from_iterable(gnss.get_output() for gnss in self.gnss))
+
+    def __make_writer(self, output, delimiter):
+        ''' Return a function that writes a list of sentences to output, each followed by
+        delimiter and encoded as ASCII if output is a binary stream. The stream type is
+        worked out once, not per write.
+        '''
+        encoded_delimiter = delimiter.encode('ascii')
+
+        def write_text(sentences):
+            output.write(delimiter.join(sentences) + delimiter)
+
+        def write_encoded(sentences):
+            output.write(delimiter.join(sentences).encode('ascii') + encoded_delimiter)
+
+        if isinstance(output, io.TextIOBase):
+            return write_text
+        if isinstance(output, (io.RawIOBase, io.BufferedIOBase)):
+            return write_encoded
+
+        # Any other file-like object: the first write tells whether it takes str or bytes
+        write = None
+
+        def write_probed(sentences):
+            nonlocal write
+            if write is None:
+                try:
+                    write_text(sentences)
+                    write = write_text
+                    return
+                except TypeError:
+                    write = write_encoded
+            write(sentences)
+
+        return write_probed
 
     def __action(self, output, delimiter):
         ''' Worker thread action for the GPS simulator - outputs data to the specified output at 1PPS.
         '''
         self.__run.set()
-        while self.__run.is_set():
-            start = time.monotonic()
-            if self.__run.is_set():
-                with self.lock:
-                    sentences = []
-                    for gnss in self.gnss:
-                        sentences += gnss.get_output()
+        # Bound methods looked up once for the lifetime of the worker
+        running = self.__run.is_set
+        write = self.__make_writer(output, delimiter)
+        wait = self.__stop.wait
+        lock = self.lock
+        monotonic = time.monotonic
+        next_tick = monotonic()  # Absolute deadlines, so waits don't add up to drift
+        while running():
+            start = monotonic()
+            with lock:
+                sentences = self.__collect_output()
+                
+                # Add to stream for GUI consumption
+                if sentences:
+                    self._add_to_stream(sentences)
+                self.__publish_state()
                     
-                    # Add to stream for GUI consumption
-                    if sentences:
-                        self._add_to_stream(sentences)
-                        
-            if self.__run.is_set():
-                for sentence in sentences:
-                    if not self.__run.is_set():
-                        break
-                    self.__write(output, sentence, delimiter)
-
-            if self.__run.is_set():
-                time.sleep(0.1)  # Minimum sleep to avoid long lock ups
-            while self.__run.is_set() and time.monotonic() - start < self.interval:
-                time.sleep(0.1)
-            if self.__run.is_set():
-                with self.lock:
+            if running() and sentences:
+                # One write per tick instead of one per sentence
+                write(sentences)
+
+            if running():
+                # Wait for the next deadline; kill() ends the wait early
+                next_tick += self.interval
+                remaining = next_tick - monotonic()
+                if remaining < MIN_TICK_WAIT:
+                    # Fell behind or the interval is too short: restart the cadence after
+                    # the minimum wait rather than burst to catch up
+                    remaining = MIN_TICK_WAIT
+                    next_tick = monotonic() + remaining
+                wait(remaining)
+            if running():
+                with lock:
                     if self.step == self.interval:
-                        self.__step(time.monotonic() - start)
+                        self.__step(monotonic() - start)
                     else:
                         self.__step(self.step)
+                    self.__publish_state()
 
     def serve(self, output=None, blocking=True, delimiter='\r\n'):
         ''' Start serving GPS simulator to the file-like output (default stdout).
@@ -208,6 +272,8 @@ class Simulator(object):
         if output is None:
             output = stdout
         self.kill()
+        self.latest = None  # Don't hand out a position from a previous run
+        self.__stop.clear()
         self.__worker = threading.Thread(
             target=self.__action,
             kwargs=dict(output=output, delimiter=delimiter))
@@ -226,6 +292,7 @@ class Simulator(object):
         try:
             while self.__worker and self.__worker.is_alive():
                 self.__run.clear()
+                self.__stop.set()
                 self.__worker.join(0.1)
         except KeyboardInterrupt:
             pass
@@ -237,31 +304,39 @@ class Simulator(object):
         '''
         return self.__run.is_set() or self.__worker and self.__worker.is_alive()
 
-    def get_output(self, duration):
+    def __output_ticks(self, duration):
         ''' Instantaneous generator for the GPS simulator.
-        Yields one NMEA sentence at a time, without the EOL.
+        Yields the list of NMEA sentences produced at each simulation step, without the EOL.
         '''
         with self.lock:
             start = self.gps.date_time
         now = start
         while (now - start).total_seconds() < duration:
             with self.lock:
-                output = []
-                for gnss in self.gnss:
-                    output += gnss.get_output()
-                for sentence in output:
-                    yield sentence
+                output = self.__collect_output()
+            # Yield outside the lock so a slow consumer doesn't hold up other users of the simulator
+            yield output
+            with self.lock:
                 self.__step(self.step)
                 now = self.gps.date_time
 
+    def get_output(self, duration):
+        ''' Instantaneous generator for the GPS simulator.
+        Yields one NMEA sentence at a time, without the EOL.
+        '''
+        for output in self.__output_ticks(duration):
+            yield from output
+
     def generate(self, duration, output=None, delimiter='\r\n'):
         ''' Instantaneous generator for the GPS simulator.
         Synchronously writes data to a file-like output (stdout by default).
         '''
         if output is None:
             output = stdout
-        for sentence in self.get_output(duration):
-            self.__write(output, sentence, delimiter)
+        write = self.__make_writer(output, delimiter)
+        for sentences in self.__output_ticks(duration):
+            if sentences:
+                write(sentences)
 
     def output_latest(self, output=None, delimiter='\r\n'):
         '''Output the latest fix to a specified file-like output (stdout by default).
@@ -269,9 +344,9 @@ class Simulator(object):
         if output is None:
             output = stdout
         with self.lock:
-            for gnss in self.gnss:
-                for sentence in gnss.get_output():
-                    self.__write(output, sentence, delimiter)
+            sentences = self.__collect_output()
+            if sentences:
+                self.__make_writer(output, delimiter)(sentences)
                     
     def get_targeting_status(self):
         """Get status information about the current targeting strategy."""
@@ -281,11 +356,8 @@ class Simulator(object):
 
     def start_auto_logging(self, filename=None):
         """Start automatic logging of all NMEA sentences to a file."""
-        import os
-        
         if filename is None:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             
             # Create logs directory in the current working directory
             logs_dir = os.path.join(os.getcwd(), "logs")
@@ -296,33 +368,33 @@ class Simulator(object):
             filename = os.path.join(logs_dir, f"nmea_log_{timestamp}.nmea")
         
         try:
-            if self._log_file_handle:
+            if self._log_fd is not None:
                 self.stop_auto_logging()
             
             self._auto_log_file = os.path.abspath(filename)
-            self._log_file_handle = open(self._auto_log_file, 'w', encoding='utf-8', buffering=1)  # Line buffered
+            self._log_fd = os.open(self._auto_log_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
             print(f"Started automatic NMEA logging to: {self._auto_log_file}")
             
             return self._auto_log_file
         except Exception as e:
             print(f"Failed to start auto logging: {e}")
-            import traceback
             traceback.print_exc()
             return None
 
     def stop_auto_logging(self):
         """Stop automatic logging and close the file."""
-        if self._log_file_handle:
+        if self._log_fd is not None:
             try:
-                self._log_file_handle.flush()
-                self._log_file_handle.close()
+                # Under the stream lock so the worker is never mid-write on a closed descriptor
+                with self._stream_lock:
+                    log_fd, self._log_fd = self._log_fd, None
+                    os.close(log_fd)
                 print(f"Stopped automatic NMEA logging to: {self._auto_log_file}")
             except Exception as e:
                 print(f"Error closing log file: {e}")
-                import traceback
                 traceback.print_exc()
             finally:
-                self._log_file_handle = None
+                self._log_fd = None
                 self._auto_log_file = None
 
     def get_log_filename(self):
@@ -331,26 +403,27 @@ class Simulator(object):
 
     def get_new_sentences(self):
         """Get all new NMEA sentences since the last call to this method."""
-        with self._stream_lock:
-            new_sentences = self._sentence_stream.copy()
-            self._sentence_stream.clear()
-            return new_sentences
+        # The worker's extend can evict old entries too, but only down to maxlen, which is
+        # at least the n entries counted here. So after k pops, n - k entries remain and n
+        # pops can't run the deque dry. Deque extends and pops are atomic, so neither side
+        # needs a lock; swapping the buffer out instead could lose an in-flight batch.
+        popleft = self._sentence_stream.popleft
+        return [popleft() for _ in range(len(self._sentence_stream))]
 
     def _add_to_stream(self, sentences):
         """Add sentences to the stream buffer and log to file if active."""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]  # Millisecond precision
+        timestamp = time.time()  # Formatted lazily by readers that display it
         
-        with self._stream_lock:
-            for sentence in sentences:
-                sentence_with_timestamp = (timestamp, sentence)
-                self._sentence_stream.append(sentence_with_timestamp)
-                
-                # Auto-log to file if active
-                if self._log_file_handle:
-                    try:
-                        self._log_file_handle.write(f"{sentence}\n")
-                        self._log_file_handle.flush()  # Ensure data is written to disk immediately
-                    except Exception as e:
-                        print(f"Error writing to log file: {e}")
-                        # Don't stop the stream, just log the error
\ No newline at end of file
+        self._sentence_stream.extend([(timestamp, sentence) for sentence in sentences])
+        
+        # Auto-log to file if active, one unbuffered write for the whole batch
+        if self._log_fd is not None:
+            with self._stream_lock:
+                log_fd = self._log_fd  # Re-read under the lock, logging may have just stopped
+                try:
+                    data = memoryview(("\n".join(sentences) + "\n").encode('ascii'))
+                    while log_fd is not None and data:
+                        data = data[os.write(log_fd, data):]
+                except Exception as e:
+                    print(f"Error writing to log file: {e}")
+                    # Don't stop the stream, just log the error
@@ -11,6 +11,7 @@ from typing import Tuple, Optional, Dict, Any, List
 import math
 import numpy as np
 from scipy import interpolate
+from scipy.spatial import cKDTree
 
 
 # Vehicle performance profiles for dynamic speed control
@@ -202,6 +203,28 @@ def calculate_distance_km(lat1: float, lon1: float, lat2: float, lon2: float) ->
     return earth_radius_km * c
 
 
+def calculate_distance_km_array(lat1: np.ndarray, lon1: np.ndarray,
+                                lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """
+    Vectorized calculate_distance_km for NumPy arrays of coordinates.
+    
+    Args:
+        lat1, lon1: First point coordinates in decimal degrees
+        lat2, lon2: Second point coordinates in decimal degrees
+        
+    Returns:
+        Array of distances in kilometers
+    """
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
+    dlat = lat2_rad - lat1_rad
+    dlon = np.radians(lon2) - np.radians(lon1)
+    
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon / 2) ** 2
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return 6371.0 * c
+
+
 def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the initial bearing from point 1 to point 2.
@@ -569,6 +592,24 @@ class WaypointTargeting(TargetingStrategy):
         # Generate smoothed path for curvature analysis
         self._smoothed_path = self._generate_smoothed_path(self.waypoints)
         
+        # Index the smoothed path in an equirectangular projection so the point nearest
+        # the vehicle can be found without measuring the distance to every path point
+        self._path_lon_scale = math.cos(math.radians(self._smoothed_path[:, 0].mean()))
+        self._path_tree = cKDTree(self._smoothed_path * (1.0, self._path_lon_scale))
+        
+        # The path is fixed, so its curvature and point spacing are computed once up front
+        # rather than re-measured for every look-ahead point on every step
+        path = self._smoothed_path
+        previous = np.roll(path, 1, axis=0)
+        # Radius through each point and the two after it (wrapping around the path end)
+        self._path_radii = self._calculate_radius_of_curvature(
+            path, np.roll(path, -1, axis=0), np.roll(path, -2, axis=0)
+        ).tolist()
+        # Distance in meters from the previous path point to each point
+        self._path_steps_m = (calculate_distance_km_array(
+            previous[:, 0], previous[:, 1], path[:, 0], path[:, 1]
+        ) * 1000).tolist()
+        
         self._current_waypoint_index = 0
         self._laps_completed = 0
         self._total_route_distance_km = None
@@ -613,35 +654,34 @@ class WaypointTargeting(TargetingStrategy):
         # Zip the coordinates back together into a 2D NumPy array and return it
         return np.dstack((x_new, y_new))[0]
     
-    def _calculate_radius_of_curvature(self, p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> float:
+    def _calculate_radius_of_curvature(self, p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> np.ndarray:
         """
         Calculate the radius of curvature using Menger curvature formula.
         
         Args:
-            p1: First point as numpy array [lat, lon]
-            p2: Second point as numpy array [lat, lon] 
-            p3: Third point as numpy array [lat, lon]
+            p1: First points as numpy array of [lat, lon] rows
+            p2: Second points as numpy array of [lat, lon] rows
+            p3: Third points as numpy array of [lat, lon] rows
             
         Returns:
-            Radius of curvature in meters
+            Array of radii of curvature in meters, one per row
         """
-        # Calculate side lengths of the triangle (p1, p2, p3) in meters
-        side_a = calculate_distance_km(p1[0], p1[1], p2[0], p2[1]) * 1000  # Convert to meters
-        side_b = calculate_distance_km(p2[0], p2[1], p3[0], p3[1]) * 1000
-        side_c = calculate_distance_km(p1[0], p1[1], p3[0], p3[1]) * 1000
+        # Calculate side lengths of the triangles (p1, p2, p3) in meters
+        side_a = calculate_distance_km_array(p1[:, 0], p1[:, 1], p2[:, 0], p2[:, 1]) * 1000  # Convert to meters
+        side_b = calculate_distance_km_array(p2[:, 0], p2[:, 1], p3[:, 0], p3[:, 1]) * 1000
+        side_c = calculate_distance_km_array(p1[:, 0], p1[:, 1], p3[:, 0], p3[:, 1]) * 1000
         
-        # Calculate the triangle's area using Heron's formula
+        # Calculate the triangles' areas using Heron's formula
         s = (side_a + side_b + side_c) / 2  # Semi-perimeter
         area_squared = s * (s - side_a) * (s - side_b) * (s - side_c)
         
         # Stability check: if the area is extremely small, the points are collinear
-        if area_squared < 1e-6:
-            return 1e9  # Return a very large number to represent an infinite radius (straight line)
-        
-        area = math.sqrt(area_squared)
+        collinear = area_squared < 1e-6
+        area = np.sqrt(np.where(collinear, 1.0, area_squared))
         
-        # Return the radius using the formula: Radius = (side_a * side_b * side_c) / (4 * area)
-        return (side_a * side_b * side_c) / (4 * area)
+        # Radius = (side_a * side_b * side_c) / (4 * area), or a very large number to
+        # represent an infinite radius (straight line) for collinear points
+        return np.where(collinear, 1e9, (side_a * side_b * side_c) / (4 * area))
     
     def _calculate_required_braking_distance(self, initial_speed_kph: float, final_speed_kph: float) -> float:
         """
@@ -756,10 +796,7 @@ class WaypointTargeting(TargetingStrategy):
         if self.mode == 'dynamic':
             # Step A: Find the Vehicle's Position on the Smoothed Path
             # Find the index of the point on the smoothed path closest to the vehicle's current position
-            current_pos = np.array([current_lat, current_lon])
-            distances = np.array([calculate_distance_km(current_lat, current_lon, point[0], point[1]) 
-                                for point in self._smoothed_path])
-            start_index = np.argmin(distances)
+            _, start_index = self._path_tree.query((current_lat, current_lon * self._path_lon_scale))
             
             # Step B: Implement the New Path Analysis Loop
             look_ahead_points = 200
@@ -784,18 +821,8 @@ class WaypointTargeting(TargetingStrategy):
                     if not self.loop and sub_idx >= len(self._smoothed_path) - 2:
                         break
                     
-                    # Get three consecutive points for curvature calculation
-                    p1_idx = sub_idx
-                    p2_idx = (sub_idx + 1) % len(self._smoothed_path)
-                    p3_idx = (sub_idx + 2) % len(self._smoothed_path)
-                    
-                    p1 = self._smoothed_path[p1_idx]
-                    p2 = self._smoothed_path[p2_idx]
-                    p3 = self._smoothed_path[p3_idx]
-                    
-                    # Calculate radius of curvature for this point
-                    radius = self._calculate_radius_of_curvature(p1, p2, p3)
-                    min_radius = min(min_radius, radius)
+                    # Radius of curvature through this point and the next two
+                    min_radius = min(min_radius, self._path_radii[sub_idx])
                 
                 # The effective_radius_m for point i is the minimum radius found within its sub-window
                 effective_radius_m = min_radius
@@ -815,12 +842,7 @@ class WaypointTargeting(TargetingStrategy):
                 if i == 0:
                     distance_to_point_m = 0.0
                 else:
-                    prev_point_idx = (start_index + i - 1) % len(self._smoothed_path)
-                    prev_point = self._smoothed_path[prev_point_idx]
-                    current_point = self._smoothed_path[point_idx]
-                    distance_step_km = calculate_distance_km(prev_point[0], prev_point[1], 
-                                                            current_point[0], current_point[1])
-                    distance_to_point_m = distance_step_km * 1000
+                    distance_to_point_m = self._path_steps_m[point_idx]
                     
                 cumulative_distance_m += distance_to_point_m
                 
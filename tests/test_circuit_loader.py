@@ -0,0 +1,81 @@
+import json
+
+import numpy as np
+import pytest
+
+from nmea_injector import circuit_loader
+from nmea_injector.circuit_loader import CircuitLoader
+from nmea_injector.targeting import calculate_distance_km_array
+
+
+def write_circuit(path, coordinates):
+    feature = {
+        'type': 'Feature',
+        'properties': {'id': 'test-1', 'Name': 'Test Circuit', 'Location': 'Testville'},
+        'geometry': {'type': 'LineString', 'coordinates': coordinates},
+    }
+    path.write_text(json.dumps({'type': 'FeatureCollection', 'features': [feature]}))
+    return str(path)
+
+
+@pytest.fixture(params=['json', 'orjson', 'simdjson'])
+def parser_backend(request, monkeypatch):
+    """Restrict circuit loading to one JSON parser backend."""
+    backend = request.param
+    if backend != 'json' and circuit_loader._optional_import(backend) is None:
+        pytest.skip(f"{backend} is not installed")
+    real_import = circuit_loader._optional_import
+    disabled = {'orjson', 'simdjson'} - {backend}
+    monkeypatch.setattr(circuit_loader, '_optional_import',
+                        lambda name: None if name in disabled else real_import(name))
+    return backend
+
+
+def test_mixed_dimension_coordinates(tmp_path, parser_backend):
+    path = write_circuit(tmp_path / 'circuits.geojson',
+                         [[2.0, 1.0], [2.1, 1.1, 50.0], [2.2, 1.2], [9.9]])
+
+    circuit = CircuitLoader(path, cache_dir=str(tmp_path / 'cache')).get_circuit('test-1')
+
+    assert circuit is not None
+    assert circuit.coordinates.tolist() == [[2.0, 1.0], [2.1, 1.1], [2.2, 1.2]]
+
+
+def test_uniform_coordinates(tmp_path, parser_backend):
+    path = write_circuit(tmp_path / 'circuits.geojson',
+                         [[2.0, 1.0, 5.0], [2.1, 1.1, 6.0], [2.2, 1.2, 7.0]])
+
+    circuit = CircuitLoader(path, cache_dir=str(tmp_path / 'cache')).get_circuit('test-1')
+
+    assert circuit.coordinates.tolist() == [[2.0, 1.0], [2.1, 1.1], [2.2, 1.2]]
+
+
+def test_cache_written_to_cache_dir(tmp_path):
+    path = write_circuit(tmp_path / 'circuits.geojson', [[2.0, 1.0], [2.1, 1.1]])
+    cache_dir = tmp_path / 'cache'
+
+    assert CircuitLoader(path, cache_dir=str(cache_dir)).get_circuit('test-1') is not None
+
+    assert [p.name for p in tmp_path.iterdir() if p.is_file()] == ['circuits.geojson']
+    assert len(list(cache_dir.glob('circuits.geojson.*.cache'))) == 1
+    reloaded = CircuitLoader(path, cache_dir=str(cache_dir))
+    assert reloaded._load_cache()
+    assert reloaded.get_circuit('test-1').coordinates.tolist() == [[2.0, 1.0], [2.1, 1.1]]
+
+
+def test_nearest_waypoint_matches_brute_force(tmp_path):
+    loader = CircuitLoader(cache_dir=str(tmp_path))
+    waypoints = np.array(loader.convert_to_waypoints('gb-1948'))
+    rng = np.random.default_rng(0)
+    # Query points scattered over and just around the circuit's bounding box
+    lo, hi = waypoints.min(axis=0) - 0.002, waypoints.max(axis=0) + 0.002
+    for lat, lon in rng.uniform(lo, hi, size=(500, 2)):
+        index, waypoint = loader.nearest_waypoint('gb-1948', lat, lon)
+
+        distances = calculate_distance_km_array(lat, lon, waypoints[:, 0], waypoints[:, 1])
+        assert distances[index] == pytest.approx(distances.min(), abs=1e-6)
+        assert waypoint == tuple(waypoints[index])
+
+
+def test_nearest_waypoint_unknown_circuit(tmp_path):
+    assert CircuitLoader(cache_dir=str(tmp_path)).nearest_waypoint('no-such-circuit', 0.0, 0.0) is None
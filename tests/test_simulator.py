@@ -0,0 +1,30 @@
+import io
+import time
+
+from nmea_injector.simulator import Simulator, MIN_TICK_WAIT
+
+
+def test_zero_interval_output_rate_is_bounded():
+    simulator = Simulator()
+    simulator.interval = 0
+    output = io.StringIO()
+    run_time = 0.5
+
+    simulator.serve(output, blocking=False)
+    time.sleep(run_time)
+    simulator.kill()
+
+    ticks = output.getvalue().count('$GPGGA')
+    assert 0 < ticks <= run_time / MIN_TICK_WAIT + 1
+
+
+def test_kill_interrupts_tick_wait():
+    simulator = Simulator()
+    simulator.interval = 10
+    simulator.serve(io.StringIO(), blocking=False)
+    time.sleep(0.2)
+
+    start = time.monotonic()
+    simulator.kill()
+    assert time.monotonic() - start < 1
+    assert not simulator.is_running()